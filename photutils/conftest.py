@@ -3,6 +3,11 @@
 Configuration file for the pytest test suite.
 """
 
+import pytest
+
+from photutils.utils import _optional_deps
+from photutils.utils._optional_deps import HAS_NUMBA
+
 try:
     from pytest_astropy_header.display import (PYTEST_HEADER_MODULES,
                                                TESTED_VERSIONS)
@@ -20,9 +25,27 @@ def pytest_configure(config):
         # running the tests.
         PYTEST_HEADER_MODULES.clear()
         deps = ['NumPy', 'SciPy', 'Matplotlib', 'Astropy', 'Regions',
-                'skimage', 'GWCS', 'Bottleneck', 'tqdm', 'Rasterio', 'Shapely']
+                'skimage', 'GWCS', 'Bottleneck', 'tqdm', 'Rasterio', 'Shapely',
+                'Numba']
         for dep in deps:
             PYTEST_HEADER_MODULES[dep] = dep.lower()
 
         from photutils import __version__
         TESTED_VERSIONS['photutils'] = __version__
+
+
+_NUMBA_MARK = pytest.mark.skipif(not HAS_NUMBA, reason='numba is required')
+
+
+@pytest.fixture(params=[False, pytest.param(True, marks=_NUMBA_MARK)],
+                ids=['numpy', 'numba'])
+def use_numba(request, monkeypatch):
+    """
+    Run a test without and (if installed) with the optional Numba
+    kernels.
+
+    Note that the kernels are used only for inputs larger than the
+    thresholds defined where they are called.
+    """
+    monkeypatch.setattr(_optional_deps, 'HAS_NUMBA', request.param)
+    return request.param
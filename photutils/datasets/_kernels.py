@@ -0,0 +1,100 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+This module provides Numba-compiled kernels for rendering simulated
+images.
+
+This module requires `Numba <https://numba.pydata.org/>`_ and must be
+imported only when Numba is installed.
+"""
+
+import math
+
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def render_gaussians(image, amplitude, x_mean, y_mean, coeff_a, coeff_b,
+                     coeff_c, local_bkg, ymin, ymax, xmin, xmax):
+    """
+    Add 2D Gaussian sources to an image in place.
+
+    Each Gaussian is evaluated at the pixel centers of its cutout
+    region, defined by the ``[ymin:ymax, xmin:xmax]`` slices, using the
+    quadratic-form coefficients of `~astropy.modeling.models.Gaussian2D`.
+
+    The image rows are distributed across threads, where each row is
+    written by only a single thread. Therefore, sources with overlapping
+    cutout regions do not cause write conflicts and the summation order
+    for each pixel is deterministic.
+
+    Parameters
+    ----------
+    image : 2D `~numpy.ndarray`
+        The float image to which the sources are added.
+
+    amplitude, x_mean, y_mean : 1D `~numpy.ndarray`
+        The amplitudes and (x, y) centers of the sources.
+
+    coeff_a, coeff_b, coeff_c : 1D `~numpy.ndarray`
+        The coefficients of the quadratic form in the Gaussian exponent.
+
+    local_bkg : 1D `~numpy.ndarray`
+        The per-pixel local background added to each cutout region.
+
+    ymin, ymax, xmin, xmax : 1D `~numpy.ndarray`
+        The integer cutout region indices of the sources.
+    """
+    nsources = amplitude.shape[0]
+    for row in prange(image.shape[0]):
+        for i in range(nsources):
+            if row < ymin[i] or row >= ymax[i]:
+                continue
+
+            ydiff = row - y_mean[i]
+            for col in range(xmin[i], xmax[i]):
+                xdiff = col - x_mean[i]
+                image[row, col] += (
+                    amplitude[i] * math.exp(-((coeff_a[i] * xdiff**2)
+                                              + (coeff_b[i] * xdiff * ydiff)
+                                              + (coeff_c[i] * ydiff**2)))
+                    + local_bkg[i])
+
+
+@njit(parallel=True, cache=True)
+def add_stamps(image, stamps, ymin, xmin):
+    """
+    Add source cutout images (stamps) to an image in place.
+
+    Each stamp is added to the image at the region starting at the
+    ``(ymin, xmin)`` pixel indices. The parts of the stamps that are
+    outside of the image are ignored.
+
+    The image rows are distributed across threads, where each row is
+    written by only a single thread. The stamps are added to each pixel
+    in order, so the result is identical to adding the stamps one at a
+    time.
+
+    Parameters
+    ----------
+    image : 2D `~numpy.ndarray`
+        The float image to which the stamps are added.
+
+    stamps : 3D `~numpy.ndarray`
+        The stamps with shape ``(n_stamps, ny, nx)``.
+
+    ymin, xmin : 1D `~numpy.ndarray`
+        The integer image indices of the lower-left pixel of each stamp.
+        The indices can be negative.
+    """
+    nstamps, ny, nx = stamps.shape
+    nrows, ncols = image.shape
+    for row in prange(nrows):
+        for i in range(nstamps):
+            yidx = row - ymin[i]
+            if yidx < 0 or yidx >= ny:
+                continue
+
+            col_start = max(xmin[i], 0)
+            col_stop = min(xmin[i] + nx, ncols)
+            for col in range(col_start, col_stop):
+                image[row, col] += stamps[i, yidx, col - xmin[i]]
@@ -5,6 +5,7 @@ documentation examples and tests.
 """
 
 import pathlib
+from functools import lru_cache
 
 import numpy as np
 from astropy.modeling.models import Gaussian2D
@@ -55,6 +56,27 @@ def make_4gaussians_image(noise=True):
         image = make_4gaussians_image()
         plt.imshow(image, origin='lower', interpolation='nearest')
     """
+    return _make_4gaussians_image(bool(noise)).copy()
+
+
+@lru_cache(maxsize=2)
+def _make_4gaussians_image(noise):
+    """
+    Make the example image containing four 2D Gaussians.
+
+    The image is deterministic, so it is cached. The returned array is
+    read-only; `make_4gaussians_image` returns a copy of it.
+
+    Parameters
+    ----------
+    noise : bool
+        Whether to include noise in the output image.
+
+    Returns
+    -------
+    image : 2D `~numpy.ndarray`
+        Read-only image containing four 2D Gaussian sources.
+    """
     shape = (100, 200)
     model = Gaussian2D()
     params = QTable.read(_DATASETS_DATA_DIR / '4gaussians_params.ecsv',
@@ -67,6 +89,8 @@ def make_4gaussians_image(noise=True):
         rng = np.random.default_rng(seed=0)
         data += rng.normal(loc=0.0, scale=5.0, size=shape)
 
+    data.flags.writeable = False
+
     return data
 
 
@@ -106,6 +130,27 @@ def make_100gaussians_image(noise=True):
         image = make_100gaussians_image()
         plt.imshow(image, origin='lower', interpolation='nearest')
     """
+    return _make_100gaussians_image(bool(noise)).copy()
+
+
+@lru_cache(maxsize=2)
+def _make_100gaussians_image(noise):
+    """
+    Make the example image containing 100 2D Gaussians.
+
+    The image is deterministic, so it is cached. The returned array is
+    read-only; `make_100gaussians_image` returns a copy of it.
+
+    Parameters
+    ----------
+    noise : bool
+        Whether to include noise in the output image.
+
+    Returns
+    -------
+    image : 2D `~numpy.ndarray`
+        Read-only image containing 100 2D Gaussian sources.
+    """
     shape = (300, 500)
     model = Gaussian2D()
     params = QTable.read(_DATASETS_DATA_DIR / '100gaussians_params.ecsv',
@@ -118,4 +163,6 @@ def make_100gaussians_image(noise=True):
         rng = np.random.default_rng(seed=0)
         data += rng.normal(loc=0.0, scale=2.0, size=shape)
 
+    data.flags.writeable = False
+
     return data
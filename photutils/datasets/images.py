@@ -4,24 +4,45 @@ This module provides tools for making simulated images for documentation
 examples and tests.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import astropy.units as u
 import numpy as np
 from astropy.convolution import discretize_model
 from astropy.modeling import Model
+from astropy.modeling.models import Gaussian2D
+from astropy.modeling.utils import ellipse_extent
 from astropy.nddata.utils import NoOverlapError
+from astropy.stats import gaussian_fwhm_to_sigma
 from astropy.table import Table
+from scipy.special import erf
 
+from photutils.utils._numba import use_numba
 from photutils.utils._parameters import as_pair
 from photutils.utils._progress_bars import add_progress_bar
 from photutils.utils.cutouts import _overlap_slices as overlap_slices
 
 __all__ = ['make_model_image']
 
+# the approximate number of pixels evaluated at once when rendering
+# sources in batches
+_BATCH_NPIXELS = 1 << 18
+
+# the minimum number of sources for rendering Gaussian2D sources in
+# parallel threads when Numba is not installed
+_THREAD_MIN_SOURCES = 1000
+
+# the minimum total number of source cutout pixels for rendering
+# sources with the Numba kernels (if Numba is installed)
+_NUMBA_MIN_NPIXELS = 1 << 20
+
 
 def make_model_image(shape, model, params_table, *, model_shape=None,
                      bbox_factor=None, x_name='x_0', y_name='y_0',
                      params_map=None, discretize_method='center',
-                     discretize_oversample=10, progress_bar=False):
+                     discretize_oversample=10, progress_bar=False,
+                     dtype=float):
     """
     Make a 2D image containing sources generated from a user-specified
     astropy 2D model.
@@ -153,7 +174,11 @@ def make_model_image(shape, model, params_table, *, model_shape=None,
     discretize_oversample : int, optional
         The integer oversampling factor used when
         ``descretize_method='oversample'``. This keyword is ignored
-        otherwise.
+        otherwise. It is also ignored for axis-aligned (i.e.,
+        ``theta=0``) `~astropy.modeling.functional_models.Gaussian2D`
+        models without units, which are integrated exactly over each
+        pixel (i.e., the limit of an infinite oversampling factor; see
+        Notes below).
 
     progress_bar : bool, optional
         Whether to display a progress bar while adding the sources
@@ -162,6 +187,14 @@ def make_model_image(shape, model, params_table, *, model_shape=None,
         Note that the progress bar does not currently work in the
         Jupyter console due to limitations in ``tqdm``.
 
+    dtype : data-type, optional
+        The floating-point data type of the output image. The sources
+        are accumulated directly in this data type. Using ``np.float32``
+        halves the memory of the output image, but the summed pixel
+        values have lower precision (about 7 significant digits), which
+        can be significant for very bright pixels or many overlapping
+        sources.
+
     Returns
     -------
     array : 2D `~numpy.ndarray`
@@ -224,6 +257,28 @@ def make_model_image(shape, model, params_table, *, model_shape=None,
     local background will be added multiple times. This is not an issue
     if the sources are well-separated, but for crowded fields, this
     option should be used with care.
+
+    Sources defined by a `~astropy.modeling.functional_models.Gaussian2D`
+    model without units are rendered using an optimized code path when
+    ``discretize_method='center'``. If the optional `Numba
+    <https://numba.pydata.org/>`_ dependency is installed, large images
+    of these sources are rendered with a compiled and multithreaded
+    kernel. Otherwise, large numbers of these sources are rendered in
+    multiple threads.
+
+    For axis-aligned (i.e., ``theta=0``) ``Gaussian2D`` models without
+    units, the ``'oversample'`` and ``'integrate'`` discretization
+    methods are computed using the analytical integral of the Gaussian
+    over each pixel. This is the exact result that these methods
+    approximate, and it is much faster to compute. Similarly,
+    axis-aligned Gaussian PRF models without units (e.g.,
+    `~photutils.psf.CircularGaussianPRF`) are rendered as the outer
+    product of their 1D pixel integrals along each axis.
+
+    If ``model_shape`` is input, sources defined by the functional
+    PSF models in `photutils.psf` (e.g., `~photutils.psf.MoffatPSF`)
+    without units are evaluated in batches of many sources at once when
+    ``discretize_method='center'``.
     """
     if not isinstance(shape, tuple) or len(shape) != 2:
         raise ValueError('shape must be a 2-tuple')
@@ -273,22 +328,81 @@ def make_model_image(shape, model, params_table, *, model_shape=None,
             raise ValueError('model_shape must be specified if the model '
                              'does not have a bounding_box attribute') from exc
 
+    if len(params_table) == 0:
+        return np.zeros(shape, dtype=dtype)
+
     if 'local_bkg' in params_table.colnames:
         local_bkg = params_table['local_bkg']
     else:
         local_bkg = np.zeros(len(params_table))
 
+    if (discretize_method == 'center' and not progress_bar
+            and _is_unitless_gaussian(model)
+            and not isinstance(local_bkg, u.Quantity)
+            and (model_shape is not None
+                 or getattr(model, '_user_bounding_box', None) is None)):
+        gaussian_params = _gaussian_source_params(model, params_table,
+                                                  params_map)
+        if gaussian_params is not None:
+            return _make_gaussian_image(shape, gaussian_params, model_shape,
+                                        bbox_factor, local_bkg, dtype=dtype)
+
     # copy the input model to leave it unchanged
     model = model.copy()
 
+    # extract the parameter columns once; indexing the columns is much
+    # faster than accessing the table rows
+    columns = {key: params_table[param] for key, param in params_map.items()}
+
+    # If the model parameters are scalars without units, the parameters
+    # for each source are set with a single write to the model
+    # parameters array, which is much faster than setting each
+    # parameter attribute.
+    param_values = None
+    if _has_unitless_scalar_params(model, params_table, params_map):
+        param_values = model.parameters.copy()
+        param_idx = [model.param_names.index(key) for key in columns]
+        # dense (n_sources, n_params) array so that the parameters for
+        # each source are a single contiguous row
+        params = np.column_stack([np.asarray(column, dtype=float)
+                                  for column in columns.values()])
+
+    sources = range(len(params_table))
     if progress_bar:  # pragma: no cover
         desc = 'Add model sources'
-        params_table = add_progress_bar(params_table, desc=desc)
+        sources = add_progress_bar(sources, desc=desc)
+
+    image = np.zeros(shape, dtype=dtype)
+
+    if (param_values is not None and discretize_method == 'center'
+            and not progress_bar and not variable_shape
+            and model_shape is not None
+            and not isinstance(local_bkg, u.Quantity)
+            and _is_batchable_model(model)):
+        all_params = np.tile(model.parameters, (len(params), 1))
+        all_params[:, param_idx] = params
+        xy_idx = [model.param_names.index(name) for name in (x_name, y_name)]
+        if np.all(np.isfinite(all_params[:, xy_idx])):
+            _add_sources_batched(image, model, all_params, xy_idx,
+                                 model_shape, np.asarray(local_bkg))
+            return image
 
-    image = np.zeros(shape, dtype=float)
-    for i, source in enumerate(params_table):
-        for key, param in params_map.items():
-            setattr(model, key, source[param])
+    # The model type does not change between sources, so the optimized
+    # renderers for Gaussian models are selected once. If the parameters
+    # are known to be unitless, then only theta needs to be checked for
+    # each source.
+    unitless = param_values is not None
+    is_gaussian = type(model) is Gaussian2D
+    is_gaussian_prf = (discretize_method == 'center'
+                       and _is_gaussian_prf(model))
+
+    for i in sources:
+        if param_values is None:
+            for key, column in columns.items():
+                setattr(model, key, column[i])
+        else:
+            param_values[param_idx] = params[i]
+            model.parameters = param_values
 
         # This assumes that if the user also uses params_table to
         # override the (x/y)_name mapping that the x_name and y_name
@@ -306,12 +420,37 @@ def make_model_image(shape, model, params_table, *, model_shape=None,
         else:
             mod_shape = model_shape
 
+        separable = is_gaussian and (model.theta.value == 0 if unitless
+                                     else _is_separable_gaussian(model))
+
         try:
             slc_lg, _ = overlap_slices(shape, mod_shape, (y0, x0), mode='trim')
 
             if discretize_method == 'center':
-                yy, xx = np.mgrid[slc_lg]
-                subimg = model(xx, yy)
+                prf_params = None
+                if is_gaussian_prf:
+                    prf_params = _gaussian_prf_params(
+                        model, check_units=not unitless)
+
+                if separable:
+                    subimg = _evaluate_separable_gaussian(
+                        slc_lg, *model.parameters[:-1])
+                elif prf_params is not None:
+                    subimg = _evaluate_gaussian_prf(slc_lg, *prf_params)
+                else:
+                    # evaluate the model on broadcastable 1D pixel
+                    # indices to avoid allocating full 2D index arrays;
+                    # use the full arrays only for models that do not
+                    # broadcast their inputs
+                    yy, xx = np.ogrid[slc_lg]
+                    subimg = model(xx, yy)
+                    if np.shape(subimg) != (yy.size, xx.size):
+                        yy, xx = np.mgrid[slc_lg]
+                        subimg = model(xx, yy)
+            elif (discretize_method in ('oversample', 'integrate')
+                  and separable):
+                subimg = _integrate_separable_gaussian(
+                    slc_lg, *model.parameters[:-1])
             else:
                 if discretize_method == 'interp':
                     discretize_method = 'linear_interp'
@@ -336,6 +475,668 @@ def make_model_image(shape, model, params_table, *, model_shape=None,
     return image
 
 
+def _has_unitless_scalar_params(model, params_table, params_map):
+    """
+    Determine whether the model parameters are scalars without units
+    and the mapped ``params_table`` columns do not have units.
+
+    Parameters
+    ----------
+    model : 2D `astropy.modeling.Model`
+        The 2D model to be used to render the sources.
+
+    params_table : `~astropy.table.Table`
+        A table containing the model parameters for each source.
+
+    params_map : dict
+        A dictionary mapping the model parameter names to the column
+        names in the input ``params_table``.
+
+    Returns
+    -------
+    result : bool
+        `True` if the model parameters can be set using the model
+        ``parameters`` array.
+    """
+    if len(model.parameters) != len(model.param_names):
+        return False
+
+    if any(getattr(model, name).unit is not None
+           for name in model.param_names):
+        return False
+
+    return not any(isinstance(params_table[column], u.Quantity)
+                   for column in params_map.values())
+
+
+def _is_unitless_gaussian(model):
+    """
+    Determine whether a model is a `Gaussian2D` model without units.
+
+    Parameters
+    ----------
+    model : 2D `astropy.modeling.Model`
+        The 2D model to be used to render the sources.
+
+    Returns
+    -------
+    result : bool
+        `True` if the model is a `Gaussian2D` model without units.
+    """
+    # subclasses are excluded because they may override the evaluate
+    # method
+    if type(model) is not Gaussian2D:
+        return False
+
+    return all(getattr(model, name).unit is None
+               for name in model.param_names)
+
+
+def _is_separable_gaussian(model):
+    """
+    Determine whether a model is an axis-aligned `Gaussian2D` model
+    without units that can be evaluated as the outer product of two 1D
+    Gaussians.
+
+    Parameters
+    ----------
+    model : 2D `astropy.modeling.Model`
+        The 2D model to be used to render the sources.
+
+    Returns
+    -------
+    result : bool
+        `True` if the model can be evaluated as a separable Gaussian.
+    """
+    return _is_unitless_gaussian(model) and model.theta.value == 0
+
+
+def _is_batchable_model(model):
+    """
+    Determine whether a model can be evaluated for many sources at once.
+
+    The photutils functional PSF models are evaluated using only
+    element-wise operations, so they can be evaluated for a batch of
+    sources by broadcasting arrays of parameter values against the
+    pixel coordinates. Subclasses are excluded because they may
+    override the ``evaluate`` method.
+
+    Parameters
+    ----------
+    model : 2D `astropy.modeling.Model`
+        The 2D model to be used to render the sources.
+
+    Returns
+    -------
+    result : bool
+        `True` if the model can be evaluated for a batch of sources.
+    """
+    # avoid a circular import (photutils.psf imports photutils.datasets)
+    from photutils.psf.functional_models import (AiryDiskPSF,
+                                                 CircularGaussianPRF,
+                                                 CircularGaussianPSF,
+                                                 CircularGaussianSigmaPRF,
+                                                 GaussianPRF, GaussianPSF,
+                                                 MoffatPSF)
+
+    return type(model) in (AiryDiskPSF, CircularGaussianPRF,
+                           CircularGaussianPSF, CircularGaussianSigmaPRF,
+                           GaussianPRF, GaussianPSF, MoffatPSF)
+
+
+def _add_sources_batched(image, model, all_params, xy_idx, model_shape,
+                         local_bkg):
+    """
+    Add sources to an image by evaluating the model for batches of
+    sources at once.
+
+    Each source is evaluated at the pixel centers of a cutout region
+    with shape ``model_shape`` (trimmed at the image edges) by offsetting
+    a common grid of pixel indices by the source position. The values
+    are added to the image in source order, so the result is identical
+    to adding the sources one at a time. If `Numba
+    <https://numba.pydata.org/>`_ is installed and the total number of
+    cutout pixels is large, then the values are added with a compiled
+    kernel that is parallelized over the image rows.
+
+    Parameters
+    ----------
+    image : 2D `~numpy.ndarray`
+        The C-contiguous image to which the sources are added in place.
+
+    model : 2D `astropy.modeling.Model`
+        The model to be used to render the sources. The model must
+        support broadcasting (see `_is_batchable_model`).
+
+    all_params : 2D `~numpy.ndarray`
+        The model parameter values for each source with shape
+        ``(n_sources, n_params)``.
+
+    xy_idx : list of 2 int
+        The indices of the x and y position parameters in
+        ``all_params``.
+
+    model_shape : 2-tuple of int
+        The shape of the cutout region around each source.
+
+    local_bkg : 1D `~numpy.ndarray`
+        The per-pixel local background value to add to each source
+        cutout region.
+    """
+    ny, nx = model_shape
+    numba = use_numba(len(all_params) * ny * nx, _NUMBA_MIN_NPIXELS)
+    if numba:
+        from photutils.datasets._kernels import add_stamps
+
+    yoffsets = np.arange(ny)[:, np.newaxis]
+    xoffsets = np.arange(nx)
+    flat_image = image.reshape(-1)
+
+    batch_size = max(1, _BATCH_NPIXELS // (ny * nx))
+    for start in range(0, len(all_params), batch_size):
+        values = all_params[start:start + batch_size]
+        bkg = local_bkg[start:start + batch_size]
+
+        # same cutout region as overlap_slices in 'trim' mode
+        xmin = np.ceil(values[:, xy_idx[0]] - (nx / 2.0)).astype(int)
+        ymin = np.ceil(values[:, xy_idx[1]] - (ny / 2.0)).astype(int)
+        yy = ymin[:, np.newaxis, np.newaxis] + yoffsets
+        xx = xmin[:, np.newaxis, np.newaxis] + xoffsets
+
+        param_values = values.T[..., np.newaxis, np.newaxis]
+        subimg = model.evaluate(xx, yy, *param_values)
+        subimg = subimg + bkg[:, np.newaxis, np.newaxis]
+
+        if numba:
+            add_stamps(image, subimg, ymin, xmin)
+            continue
+
+        mask = ((yy >= 0) & (yy < image.shape[0])
+                & (xx >= 0) & (xx < image.shape[1]))
+        np.add.at(flat_image, (yy * image.shape[1] + xx)[mask],
+                  subimg[mask])
+
+
+def _is_gaussian_prf(model):
+    """
+    Determine whether a model is a Gaussian PRF model.
+
+    Parameters
+    ----------
+    model : 2D `astropy.modeling.Model`
+        The 2D model to be used to render the sources.
+
+    Returns
+    -------
+    result : bool
+        `True` if the model is a `~photutils.psf.CircularGaussianPRF`,
+        `~photutils.psf.CircularGaussianSigmaPRF`, or
+        `~photutils.psf.GaussianPRF` model. Subclasses are excluded
+        because they may override the ``evaluate`` method.
+    """
+    # avoid a circular import (photutils.psf imports photutils.datasets)
+    from photutils.psf.functional_models import (CircularGaussianPRF,
+                                                 CircularGaussianSigmaPRF,
+                                                 GaussianPRF)
+
+    return type(model) in (CircularGaussianPRF, CircularGaussianSigmaPRF,
+                           GaussianPRF)
+
+
+def _gaussian_prf_params(model, check_units=True):
+    """
+    Get the parameters of an axis-aligned Gaussian PRF model without
+    units.
+
+    Parameters
+    ----------
+    model : 2D `astropy.modeling.Model`
+        A Gaussian PRF model (see `_is_gaussian_prf`).
+
+    check_units : bool, optional
+        Whether to check that the model parameters do not have units.
+        This can be skipped if the parameters are known to be unitless.
+
+    Returns
+    -------
+    result : tuple of float or `None`
+        The ``flux``, ``x_0``, ``y_0``, ``x_sigma``, and ``y_sigma``
+        parameters for `_evaluate_gaussian_prf`. `None` is returned if
+        the model is not axis-aligned or has units.
+    """
+    if check_units and any(getattr(model, name).unit is not None
+                           for name in model.param_names):
+        return None
+
+    # the Gaussian PRF model classes are distinguished by their
+    # parameter names
+    if 'fwhm' in model.param_names:
+        x_sigma = y_sigma = model.fwhm.value * gaussian_fwhm_to_sigma
+    elif 'sigma' in model.param_names:
+        x_sigma = y_sigma = model.sigma.value
+    else:
+        if model.theta.value != 0:
+            return None
+        x_sigma = model.x_fwhm.value * gaussian_fwhm_to_sigma
+        y_sigma = model.y_fwhm.value * gaussian_fwhm_to_sigma
+
+    return (model.flux.value, model.x_0.value, model.y_0.value, x_sigma,
+            y_sigma)
+
+
+def _evaluate_gaussian_prf(slc_lg, flux, x_0, y_0, x_sigma, y_sigma):
+    """
+    Evaluate an axis-aligned Gaussian PRF model at the pixels of the
+    region defined by the input slices.
+
+    The PRF (a 2D Gaussian integrated over the pixels) is evaluated as
+    the outer product of the 1D pixel integrals along each axis, which
+    requires only ``2 * (ny + nx)`` error function evaluations instead
+    of ``4 * ny * nx``. The result is identical to evaluating the PRF
+    model.
+
+    Parameters
+    ----------
+    slc_lg : tuple of 2 slices
+        The (y, x) slices of the large array to be evaluated.
+
+    flux, x_0, y_0 : float
+        The total flux and position of the PRF.
+
+    x_sigma, y_sigma : float
+        The standard deviations of the Gaussian along the x and y axes.
+
+    Returns
+    -------
+    result : 2D `~numpy.ndarray`
+        The evaluated PRF.
+    """
+    def _integrate_1d(slc, center, sigma):
+        x0 = np.arange(slc.start, slc.stop) - center
+        return (erf((x0 + 0.5) / (np.sqrt(2) * sigma))
+                - erf((x0 - 0.5) / (np.sqrt(2) * sigma)))
+
+    xint = _integrate_1d(slc_lg[1], x_0, x_sigma)
+    yint = _integrate_1d(slc_lg[0], y_0, y_sigma)
+
+    return flux / 4.0 * np.outer(yint, xint)
+
+
+def _evaluate_separable_gaussian(slc_lg, amplitude, x_mean, y_mean,
+                                 x_stddev, y_stddev):
+    """
+    Evaluate an axis-aligned 2D Gaussian at the pixel centers of the
+    region defined by the input slices.
+
+    The Gaussian is evaluated as the outer product of two 1D Gaussians,
+    which requires only ``ny + nx`` exponential evaluations instead of
+    ``ny * nx``.
+
+    Parameters
+    ----------
+    slc_lg : tuple of 2 slices
+        The (y, x) slices of the large array to be evaluated.
+
+    amplitude, x_mean, y_mean, x_stddev, y_stddev : float
+        The `Gaussian2D` parameters.
+
+    Returns
+    -------
+    result : 2D `~numpy.ndarray`
+        The evaluated Gaussian.
+    """
+    xx = np.arange(slc_lg[1].start, slc_lg[1].stop)
+    yy = np.arange(slc_lg[0].start, slc_lg[0].stop)
+    xgauss = np.exp(-0.5 * ((xx - x_mean) / x_stddev) ** 2)
+    ygauss = np.exp(-0.5 * ((yy - y_mean) / y_stddev) ** 2)
+
+    return amplitude * np.outer(ygauss, xgauss)
+
+
+def _integrate_separable_gaussian(slc_lg, amplitude, x_mean, y_mean,
+                                  x_stddev, y_stddev):
+    """
+    Calculate the average value of an axis-aligned 2D Gaussian over the
+    pixels of the region defined by the input slices.
+
+    The integral of the Gaussian over each (unit area) pixel is the
+    product of the 1D Gaussian integrals along each axis, which are
+    computed using the error function at the pixel edges.
+
+    Parameters
+    ----------
+    slc_lg : tuple of 2 slices
+        The (y, x) slices of the large array to be evaluated.
+
+    amplitude, x_mean, y_mean, x_stddev, y_stddev : float
+        The `Gaussian2D` parameters.
+
+    Returns
+    -------
+    result : 2D `~numpy.ndarray`
+        The pixel-integrated Gaussian.
+    """
+    def _integrate_1d(slc, mean, stddev):
+        edges = np.arange(slc.start, slc.stop + 1) - 0.5
+        return (np.sqrt(np.pi / 2.0) * stddev
+                * np.diff(erf((edges - mean) / (np.sqrt(2.0) * stddev))))
+
+    xint = _integrate_1d(slc_lg[1], x_mean, x_stddev)
+    yint = _integrate_1d(slc_lg[0], y_mean, y_stddev)
+
+    return amplitude * np.outer(yint, xint)
+
+
+def _gaussian_source_params(model, params_table, params_map):
+    """
+    Get the `Gaussian2D` parameter values for each source as arrays.
+
+    Model parameters that are not defined in ``params_map`` are set to
+    the ``model`` value for all sources.
+
+    Parameters
+    ----------
+    model : `~astropy.modeling.functional_models.Gaussian2D`
+        A 2D Gaussian model without units.
+
+    params_table : `~astropy.table.Table`
+        A table containing the model parameters for each source.
+
+    params_map : dict
+        A dictionary mapping the model parameter names to the column
+        names in the input ``params_table``.
+
+    Returns
+    -------
+    params : dict or `None`
+        A dictionary of the model parameter names and the 1D float
+        arrays of the parameter values. `None` is returned if any of the
+        parameter columns have units or contain non-finite positions.
+    """
+    n_sources = len(params_table)
+    params = {}
+    for name in model.param_names:
+        if name in params_map:
+            column = params_table[params_map[name]]
+            if isinstance(column, u.Quantity):
+                return None
+            params[name] = np.asarray(column, dtype=float)
+        else:
+            params[name] = np.full(n_sources, getattr(model, name).value,
+                                   dtype=float)
+
+    if not (np.all(np.isfinite(params['x_mean']))
+            and np.all(np.isfinite(params['y_mean']))):
+        return None
+
+    return params
+
+
+def _overlap_limits(size, center, cutout_size):
+    """
+    Calculate the start and stop indices of the overlap between 1D
+    cutouts and a large array.
+
+    The indices are identical to the slices returned by
+    `~astropy.nddata.utils.overlap_slices` with ``mode='trim'``. Cutouts
+    that do not overlap the large array will have ``start == stop``.
+
+    Parameters
+    ----------
+    size : int
+        The size of the large array.
+
+    center : 1D `~numpy.ndarray`
+        The center positions of the cutouts.
+
+    cutout_size : int or 1D `~numpy.ndarray`
+        The sizes of the cutouts.
+
+    Returns
+    -------
+    start, stop : 1D `~numpy.ndarray`
+        The start and stop indices of the overlapping regions.
+    """
+    idx_min = np.ceil(center - (cutout_size / 2.0)).astype(int)
+    idx_max = idx_min + cutout_size
+
+    return np.clip(idx_min, 0, size), np.clip(idx_max, 0, size)
+
+
+def _make_gaussian_image(shape, params, model_shape, bbox_factor,
+                         local_bkg, dtype=float):
+    """
+    Make an image containing `Gaussian2D` sources.
+
+    This is a fast path for `make_model_image` for unitless `Gaussian2D`
+    models that are discretized using the ``'center'`` method. The
+    source cutout regions are calculated for all sources at once and the
+    sources are rendered without using the `~astropy.modeling.Model`
+    machinery. If `Numba <https://numba.pydata.org/>`_ is installed and
+    the total number of cutout pixels is large, then the sources are
+    rendered with a compiled kernel that is parallelized over the image
+    rows. Otherwise, large numbers of sources are rendered in threads
+    that each fill a separate band of image rows.
+
+    Parameters
+    ----------
+    shape : 2-tuple of int
+        The shape of the output image.
+
+    params : dict
+        A dictionary of the `Gaussian2D` parameter names and the 1D
+        float arrays of the parameter values for each source.
+
+    model_shape : `None`, 2-tuple of int, or 2D `~numpy.ndarray`
+        The shape of the cutout region around each source. If a 2D
+        array, it must have shape ``(n_sources, 2)``. If `None`, then
+        the shape is calculated from the `Gaussian2D` bounding box.
+
+    bbox_factor : `None` or float
+        The multiple of the standard deviations used to define the
+        bounding box. This keyword is ignored if ``model_shape`` is
+        input.
+
+    local_bkg : 1D `~numpy.ndarray`
+        The per-pixel local background value to add to each source
+        cutout region.
+
+    dtype : data-type, optional
+        The floating-point data type of the output image.
+
+    Returns
+    -------
+    image : 2D `~numpy.ndarray`
+        The rendered image.
+    """
+    n_sources = len(params['amplitude'])
+    if model_shape is None:
+        model_shape = _gaussian_model_shape(
+            params['x_mean'], params['y_mean'], params['x_stddev'],
+            params['y_stddev'], params['theta'], bbox_factor=bbox_factor)
+        model_shape = np.transpose(model_shape)
+    else:
+        model_shape = np.broadcast_to(model_shape, (n_sources, 2))
+
+    ymin, ymax = _overlap_limits(shape[0], params['y_mean'],
+                                 model_shape[:, 0])
+    xmin, xmax = _overlap_limits(shape[1], params['x_mean'],
+                                 model_shape[:, 1])
+
+    # exclude sources that do not overlap the image; the parameter
+    # arrays are copied only if some sources are excluded
+    local_bkg = np.asarray(local_bkg, dtype=float)
+    overlap = (ymax > ymin) & (xmax > xmin)
+    if not np.all(overlap):
+        params = {key: value[overlap] for key, value in params.items()}
+        local_bkg = local_bkg[overlap]
+        ymin, ymax = ymin[overlap], ymax[overlap]
+        xmin, xmax = xmin[overlap], xmax[overlap]
+
+    image = np.zeros(shape, dtype=dtype)
+
+    npixels = np.sum((ymax - ymin) * (xmax - xmin))
+    if use_numba(npixels, _NUMBA_MIN_NPIXELS):
+        from photutils.datasets._kernels import render_gaussians
+
+        coeff_a, coeff_b, coeff_c = _gaussian_coefficients(
+            params['x_stddev'], params['y_stddev'], params['theta'])
+
+        render_gaussians(image, params['amplitude'], params['x_mean'],
+                         params['y_mean'], coeff_a, coeff_b, coeff_c,
+                         local_bkg, ymin, ymax, xmin, xmax)
+
+        return image
+
+    param_values = [params[name] for name in Gaussian2D.param_names]
+    param_values.append(local_bkg)
+
+    # Render the sources in parallel threads, each one adding the
+    # sources to a separate band of image rows. The bands are disjoint,
+    # so the result does not depend on the number of threads.
+    nthreads = min(os.cpu_count() or 1, shape[0])
+    if nthreads > 1 and len(ymin) >= _THREAD_MIN_SOURCES:
+        bands = np.linspace(0, shape[0], nthreads + 1).astype(int)
+        with ThreadPoolExecutor(max_workers=nthreads) as executor:
+            futures = [executor.submit(_render_gaussian_band, image,
+                                       param_values, ymin, ymax, xmin,
+                                       xmax, *band)
+                       for band in zip(bands[:-1], bands[1:],
+                                       strict=True)]
+            for future in futures:
+                future.result()
+    else:
+        _render_gaussian_band(image, param_values, ymin, ymax, xmin, xmax,
+                              0, shape[0])
+
+    return image
+
+
+def _render_gaussian_band(image, param_values, ymin, ymax, xmin, xmax,
+                          band_min, band_max):
+    """
+    Add `Gaussian2D` sources to a band of image rows.
+
+    Only the parts of the source cutout regions that are within the
+    band of rows are added to the image.
+
+    Parameters
+    ----------
+    image : 2D `~numpy.ndarray`
+        The image to which the sources are added in place.
+
+    param_values : list of 1D `~numpy.ndarray`
+        The `Gaussian2D` parameter values, in the order of the model
+        parameter names, followed by the local background for each
+        source.
+
+    ymin, ymax, xmin, xmax : 1D `~numpy.ndarray`
+        The limits of the source cutout regions in the image.
+
+    band_min, band_max : int
+        The first and last (exclusive) rows of the band.
+    """
+    ymin = np.maximum(ymin, band_min)
+    ymax = np.minimum(ymax, band_max)
+    idx = np.flatnonzero(ymax > ymin)
+
+    for i in idx:
+        *values, bkg = (value[i] for value in param_values)
+        slc_lg = (slice(ymin[i], ymax[i]), slice(xmin[i], xmax[i]))
+        if values[-1] == 0:  # theta
+            subimg = _evaluate_separable_gaussian(slc_lg, *values[:-1])
+        else:
+            yy, xx = np.ogrid[slc_lg]
+            subimg = Gaussian2D.evaluate(xx, yy, *values)
+        image[slc_lg] += subimg + bkg
+
+
+def _gaussian_coefficients(x_stddev, y_stddev, theta):
+    """
+    Calculate the coefficients of the quadratic form in the exponent of
+    `Gaussian2D` models.
+
+    The arithmetic is identical to `Gaussian2D.evaluate
+    <astropy.modeling.functional_models.Gaussian2D.evaluate>`, but it
+    is performed in place on preallocated arrays to minimize temporary
+    arrays.
+
+    Parameters
+    ----------
+    x_stddev, y_stddev, theta : 1D `~numpy.ndarray`
+        The `Gaussian2D` parameters.
+
+    Returns
+    -------
+    coeff_a, coeff_b, coeff_c : 1D `~numpy.ndarray`
+        The coefficients of the ``x**2``, ``x * y``, and ``y**2`` terms,
+        respectively.
+    """
+    x_stddev = np.asarray(x_stddev, dtype=float)
+    y_stddev = np.asarray(y_stddev, dtype=float)
+    theta = np.asarray(theta, dtype=float)
+
+    xstd2 = np.square(x_stddev)
+    ystd2 = np.square(y_stddev)
+    cost2 = np.square(np.cos(theta))
+    sint2 = np.square(np.sin(theta))
+    sin2t = np.sin(2.0 * theta)
+    tmp = np.empty_like(xstd2)
+
+    coeff_a = np.divide(cost2, xstd2)
+    coeff_a += np.divide(sint2, ystd2, out=tmp)
+    coeff_a *= 0.5
+
+    coeff_b = np.divide(sin2t, xstd2)
+    coeff_b -= np.divide(sin2t, ystd2, out=tmp)
+    coeff_b *= 0.5
+
+    coeff_c = np.divide(sint2, xstd2, out=sint2)
+    coeff_c += np.divide(cost2, ystd2, out=cost2)
+    coeff_c *= 0.5
+
+    return coeff_a, coeff_b, coeff_c
+
+
+def _gaussian_model_shape(x_mean, y_mean, x_stddev, y_stddev, theta,
+                          bbox_factor=None):
+    """
+    Calculate the model shape of `Gaussian2D` models.
+
+    The shape is identical to that computed from the `Gaussian2D`
+    bounding box, but it is calculated directly from the model
+    parameters to avoid the overhead of creating a bounding box object
+    for every source.
+
+    Parameters
+    ----------
+    x_mean, y_mean, x_stddev, y_stddev, theta : float or array_like
+        The `Gaussian2D` parameters.
+
+    bbox_factor : `None` or float, optional
+        The multiple of the model standard deviations used to define
+        the bounding box limits. If `None`, the default `Gaussian2D`
+        bounding box factor of 5.5 will be used.
+
+    Returns
+    -------
+    ny, nx : int or 1D `~numpy.ndarray`
+        The (ny, nx) shape around the (x, y) center of the model that
+        will used to evaluate the model.
+    """
+    if bbox_factor is None:
+        bbox_factor = 5.5  # Gaussian2D bounding_box default
+
+    dx, dy = ellipse_extent(bbox_factor * np.asarray(x_stddev),
+                            bbox_factor * np.asarray(y_stddev), theta)
+
+    # match the Gaussian2D bounding box (lower, upper) limits
+    ny = np.ceil((y_mean + dy) - (y_mean - dy)).astype(int)
+    nx = np.ceil((x_mean + dx) - (x_mean - dx)).astype(int)
+
+    return ny, nx
+
+
 def _model_shape_from_bbox(model, bbox_factor=None):
     """
     Calculate the model shape from the model bounding box.
@@ -363,6 +1164,14 @@ def _model_shape_from_bbox(model, bbox_factor=None):
     ValueError
         If the model does not have a bounding_box attribute.
     """
+    # use the faster Gaussian2D calculation unless the user has set a
+    # custom bounding box
+    if (_is_unitless_gaussian(model)
+            and getattr(model, '_user_bounding_box', None) is None):
+        ny, nx = _gaussian_model_shape(*model.parameters[1:],
+                                       bbox_factor=bbox_factor)
+        return int(ny), int(nx)
+
     try:
         hasattr(model, 'bounding_box')
     except NotImplementedError as exc:
@@ -143,7 +143,9 @@ def make_model_params(shape, n_sources, *, x_name='x_0', y_name='y_0',
     for param, prange in kwargs.items():
         if len(prange) != 2:
             raise ValueError(f'{param} must be a 2-tuple')
-        vals = rng.uniform(*prange, len(model_params))
+
+    values = _uniform_params(rng, kwargs.values(), len(model_params))
+    for param, vals in zip(kwargs.keys(), values, strict=True):
         model_params[param] = vals
 
     return model_params
@@ -218,14 +220,48 @@ def make_random_models_table(n_sources, param_ranges, seed=None):
     sources = QTable()
     sources.meta.update(_get_meta())  # keep sources.meta type
     sources['id'] = np.arange(n_sources) + 1
-    for param_name, (lower, upper) in param_ranges.items():
-        # Generate a column for every item in param_ranges, even if it
-        # is not in the model (e.g., flux).
-        sources[param_name] = rng.uniform(lower, upper, n_sources)
+
+    # Generate a column for every item in param_ranges, even if it is
+    # not in the model (e.g., flux).
+    values = _uniform_params(rng, param_ranges.values(), n_sources)
+    for param_name, vals in zip(param_ranges.keys(), values, strict=True):
+        sources[param_name] = vals
 
     return sources
 
 
+def _uniform_params(rng, param_ranges, n_values):
+    """
+    Draw uniformly distributed values for a sequence of parameter
+    ranges using a single call to the random number generator.
+
+    The values are identical to those drawn from sequential calls to
+    ``rng.uniform`` for each parameter range.
+
+    Parameters
+    ----------
+    rng : `numpy.random.Generator`
+        The random number generator.
+
+    param_ranges : iterable of 2-tuples
+        The ``(lower, upper)`` bounds for each parameter.
+
+    n_values : int
+        The number of values to draw for each parameter.
+
+    Returns
+    -------
+    values : 2D `~numpy.ndarray`
+        An array of shape ``(n_params, n_values)`` containing the
+        parameter values.
+    """
+    bounds = np.array(list(param_ranges), dtype=float).reshape(-1, 2)
+    lower = bounds[:, 0:1]
+    upper = bounds[:, 1:2]
+
+    return lower + (upper - lower) * rng.random((len(bounds), n_values))
+
+
 def params_table_to_models(params_table, model):
     """
     Create a list of models from a table of model parameters.
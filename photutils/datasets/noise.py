@@ -7,8 +7,12 @@ import numpy as np
 
 __all__ = ['apply_poisson_noise', 'make_noise_image']
 
+# The approximate size (in bytes) of the temporary 64-bit arrays used to
+# generate noise in tiles when an output dtype is specified.
+_TILE_BYTES = 1 << 20
 
-def apply_poisson_noise(data, seed=None):
+
+def apply_poisson_noise(data, seed=None, dtype=None):
     """
     Apply Poisson noise to an array, where the value of each element in
     the input array represents the expected number of counts.
@@ -27,6 +31,14 @@ def apply_poisson_noise(data, seed=None):
         A seed to initialize the `numpy.random.BitGenerator`. If `None`,
         then fresh, unpredictable entropy will be pulled from the OS.
 
+    dtype : data-type or `None`, optional
+        The data type of the output array (e.g., ``np.float32``). If
+        `None`, then the output array will have the integer data type
+        returned by `numpy.random.Generator.poisson`. If specified, then
+        the Poisson samples are generated in tiles that are cast into
+        the output array, which avoids allocating a full-size integer
+        array. The random values are identical in either case.
+
     Returns
     -------
     result : `~numpy.ndarray`
@@ -61,11 +73,60 @@ def apply_poisson_noise(data, seed=None):
 
     rng = np.random.default_rng(seed)
 
-    return rng.poisson(data)
+    if dtype is None:
+        return rng.poisson(data)
+
+    def sample(tile, tile_shape):
+        return rng.poisson(data[tile])
+
+    return _sample_tiled(sample, data.shape, dtype)
+
+
+def _sample_tiled(sample, shape, dtype):
+    """
+    Generate random samples in tiles along the first axis and cast them
+    into an output array of the given data type.
+
+    The tiles are drawn in order, so the values are identical to those
+    from a single call to the random number generator for the full
+    shape.
+
+    Parameters
+    ----------
+    sample : callable
+        A function that takes the slice of the tile along the first axis
+        and the tile shape, and returns the 64-bit random samples for
+        the tile.
+
+    shape : tuple of int
+        The shape of the output array.
+
+    dtype : data-type
+        The data type of the output array.
+
+    Returns
+    -------
+    result : `~numpy.ndarray`
+        The array of random samples.
+    """
+    result = np.empty(shape, dtype=dtype)
+    if result.ndim == 0 or result.size == 0:
+        result[...] = sample(Ellipsis, shape)
+        return result
+
+    # the number of elements along the first axis in each tile
+    row_size = result.size // shape[0]
+    tile_rows = max(1, _TILE_BYTES // (8 * row_size))
+
+    for start in range(0, shape[0], tile_rows):
+        tile = slice(start, start + tile_rows)
+        result[tile] = sample(tile, result[tile].shape)
+
+    return result
 
 
 def make_noise_image(shape, distribution='gaussian', mean=None, stddev=None,
-                     seed=None):
+                     seed=None, dtype=None):
     r"""
     Make a noise image containing Gaussian or Poisson noise.
 
@@ -99,6 +160,14 @@ def make_noise_image(shape, distribution='gaussian', mean=None, stddev=None,
         A seed to initialize the `numpy.random.BitGenerator`. If `None`,
         then fresh, unpredictable entropy will be pulled from the OS.
 
+    dtype : data-type or `None`, optional
+        The data type of the output image (e.g., ``np.float32``). If
+        `None`, then the output image will be float64 for Gaussian noise
+        and integer for Poisson noise. Specifying ``dtype`` generates
+        the noise in tiles that are cast into the output image, which
+        avoids allocating a full-size 64-bit array. The random values
+        are identical (before the cast) in either case.
+
     Returns
     -------
     image : 2D `~numpy.ndarray`
@@ -137,9 +206,26 @@ def make_noise_image(shape, distribution='gaussian', mean=None, stddev=None,
     if distribution == 'gaussian':
         if stddev is None:
             raise ValueError('"stddev" must be input for Gaussian noise')
-        image = rng.normal(loc=mean, scale=stddev, size=shape)
+        if dtype is None:
+            image = rng.normal(loc=mean, scale=stddev, size=shape)
+        else:
+            # equivalent to rng.normal(loc=mean, scale=stddev), but
+            # scaled in place
+            def sample(tile, tile_shape):
+                values = rng.standard_normal(tile_shape)
+                values *= stddev
+                values += mean
+                return values
+
+            image = _sample_tiled(sample, shape, dtype)
     elif distribution == 'poisson':
-        image = rng.poisson(lam=mean, size=shape)
+        if dtype is None:
+            image = rng.poisson(lam=mean, size=shape)
+        else:
+            def sample(tile, tile_shape):
+                return rng.poisson(lam=mean, size=tile_shape)
+
+            image = _sample_tiled(sample, shape, dtype)
     else:
         raise ValueError(f'Invalid distribution: {distribution}. Use either '
                          '"gaussian" or "poisson".')
@@ -3,7 +3,7 @@
 Tests for the examples module.
 """
 
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_equal
 
 from photutils.datasets import make_4gaussians_image, make_100gaussians_image
 
@@ -22,3 +22,17 @@ def test_make_100gaussians_image():
     image = make_100gaussians_image()
     assert image.shape == shape
     assert_allclose(image.sum(), data_sum, rtol=1.0e-6)
+
+
+def test_make_gaussians_image_copy():
+    for func in (make_4gaussians_image, make_100gaussians_image):
+        for noise in (True, False):
+            image1 = func(noise=noise)
+            image2 = func(noise=noise)
+            assert image1.flags.writeable
+            assert image1 is not image2
+            assert_equal(image1, image2)
+
+            # modifying the output does not change later calls
+            image1 += 100.0
+            assert_equal(func(noise=noise), image2)
@@ -6,13 +6,20 @@ Tests for the images module.
 import astropy.units as u
 import numpy as np
 import pytest
-from astropy.modeling.models import Moffat2D
+from astropy.convolution import discretize_model
+from astropy.modeling import custom_model
+from astropy.modeling.models import Gaussian2D, Moffat2D
+from astropy.nddata import NoOverlapError
 from astropy.table import QTable
 from numpy.testing import assert_allclose
 
-from photutils.datasets import make_model_image
-from photutils.psf import (CircularGaussianPSF, CircularGaussianSigmaPRF,
-                           ImagePSF)
+from photutils.datasets import images, make_model_image
+from photutils.datasets.images import _gaussian_coefficients, _overlap_limits
+from photutils.psf import (AiryDiskPSF, CircularGaussianPRF,
+                           CircularGaussianPSF, CircularGaussianSigmaPRF,
+                           GaussianPRF, GaussianPSF, ImagePSF, MoffatPSF)
+from photutils.utils import _optional_deps
+from photutils.utils.cutouts import _overlap_slices as overlap_slices
 
 
 def test_make_model_image():
@@ -68,6 +75,52 @@ def test_make_model_image_units():
         make_model_image(shape, model, params, model_shape=model_shape)
 
 
+def test_make_model_image_params():
+    """
+    Test that the model parameters are correctly set for each source.
+    """
+    params = QTable()
+    params['x_0'] = [50, 70.3, 90]
+    params['y_0'] = [50, 50.4, 50]
+    params['gamma2'] = [1.7, 2.32, 5.8]
+    params['alpha'] = [2.9, 5.7, 4.6]
+    params_map = {'gamma': 'gamma2'}
+    model = Moffat2D(amplitude=3.1)
+    shape = (100, 120)
+    model_shape = (11, 11)
+    image = make_model_image(shape, model, params, model_shape=model_shape,
+                             params_map=params_map)
+    assert_allclose(model.parameters, Moffat2D(amplitude=3.1).parameters)
+
+    expected = np.zeros(shape)
+    for row in params:
+        model = Moffat2D(3.1, row['x_0'], row['y_0'], row['gamma2'],
+                         row['alpha'])
+        slc_lg, _ = overlap_slices(shape, model_shape,
+                                   (row['y_0'], row['x_0']), mode='trim')
+        yy, xx = np.mgrid[slc_lg]
+        expected[slc_lg] += model(xx, yy)
+    assert_allclose(image, expected)
+
+
+def test_make_model_image_no_broadcast():
+    """
+    Test a model whose output shape depends only on the x input, and
+    therefore does not broadcast the (x, y) inputs.
+    """
+    @custom_model
+    def flat_model(x, y, x_0=0.0, y_0=0.0, flux=1.0):
+        return np.full(np.shape(x), flux)
+
+    params = QTable()
+    params['x_0'] = [20, 50]
+    params['y_0'] = [20, 40]
+    params['flux'] = [1.0, 2.0]
+    shape = (60, 80)
+    image = make_model_image(shape, flat_model(), params, model_shape=(5, 7))
+    assert_allclose(image.sum(), 3.0 * 5 * 7)
+
+
 def test_make_model_image_discretize_method():
     params = QTable()
     params['x_0'] = [50, 70, 90]
@@ -84,6 +137,265 @@ def test_make_model_image_discretize_method():
         assert image.sum() > 1
 
 
+def test_make_model_image_separable_gaussian():
+    params = QTable()
+    params['x_mean'] = [30.3, 50, 70.5]
+    params['y_mean'] = [40, 50.8, 60]
+    params['x_stddev'] = [1.5, 2.3, 3.1]
+    params['y_stddev'] = [2.2, 1.4, 3.7]
+    params['amplitude'] = [10, 20, 30]
+    model = Gaussian2D()
+    shape = (100, 120)
+    image = make_model_image(shape, model, params, x_name='x_mean',
+                             y_name='y_mean')
+
+    yy, xx = np.mgrid[:shape[0], :shape[1]]
+    expected = np.zeros(shape)
+    for row in params:
+        model = Gaussian2D(row['amplitude'], row['x_mean'], row['y_mean'],
+                           row['x_stddev'], row['y_stddev'])
+        expected += model(xx, yy)
+    assert_allclose(image, expected, atol=1.0e-4)
+
+
+def test_make_model_image_gaussian(monkeypatch, use_numba):
+    monkeypatch.setattr(images, '_NUMBA_MIN_NPIXELS', 1)
+
+    params = QTable()
+    params['x_mean'] = [30.3, 50, 70.5, 1.2, 150.0]
+    params['y_mean'] = [40, 50.8, 60, 98.7, 50.0]
+    params['x_stddev'] = [1.5, 2.3, 3.1, 2.0, 2.0]
+    params['y_stddev'] = [2.2, 1.4, 3.7, 1.0, 1.0]
+    params['theta'] = [0.0, 0.5, 2.0, 1.0, 0.0]
+    params['amplitude'] = [10, 20, 30, 40, 50]
+    params['local_bkg'] = [0.1, 0.2, 0.3, 0.4, 0.5]
+    model = Gaussian2D()
+    shape = (100, 120)
+    model_shape = (25, 21)
+    image = make_model_image(shape, model, params, model_shape=model_shape,
+                             x_name='x_mean', y_name='y_mean')
+
+    expected = np.zeros(shape)
+    for row in params[:-1]:  # the last source is outside the image
+        gmodel = Gaussian2D(row['amplitude'], row['x_mean'], row['y_mean'],
+                            row['x_stddev'], row['y_stddev'], row['theta'])
+        slc_lg, _ = overlap_slices(shape, model_shape,
+                                   (row['y_mean'], row['x_mean']),
+                                   mode='trim')
+        yy, xx = np.mgrid[slc_lg]
+        expected[slc_lg] += gmodel(xx, yy) + row['local_bkg']
+    assert_allclose(image, expected, rtol=1.0e-12, atol=1.0e-12)
+
+
+@pytest.mark.parametrize('discretize_method', ['center', 'oversample'])
+def test_make_model_image_gaussian_subclass(discretize_method):
+    class DoubleGaussian2D(Gaussian2D):
+        @staticmethod
+        def evaluate(x, y, amplitude, x_mean, y_mean, x_stddev, y_stddev,
+                     theta):
+            return 2 * Gaussian2D.evaluate(x, y, amplitude, x_mean, y_mean,
+                                           x_stddev, y_stddev, theta)
+
+    # the overridden evaluate method of a Gaussian2D subclass must be
+    # used instead of the optimized Gaussian2D code paths
+    params = QTable()
+    params['x_mean'] = [25.0]
+    params['y_mean'] = [25.0]
+    params['amplitude'] = [1.0]
+    model = DoubleGaussian2D(x_stddev=2.0, y_stddev=2.0)
+    image = make_model_image((51, 51), model, params, model_shape=(15, 15),
+                             x_name='x_mean', y_name='y_mean',
+                             discretize_method=discretize_method)
+    model.x_mean = model.y_mean = 25.0
+    expected = discretize_model(model, (18, 33), (18, 33),
+                                mode=discretize_method)
+    assert_allclose(image[18:33, 18:33], expected)
+    assert_allclose(image.max(), 2.0, rtol=0.05)
+
+
+def test_make_model_image_gaussian_prf_subclass():
+    class DoubleCircularGaussianPRF(CircularGaussianPRF):
+        def evaluate(self, x, y, flux, x_0, y_0, fwhm):
+            return 2 * super().evaluate(x, y, flux, x_0, y_0, fwhm)
+
+    # the overridden evaluate method of a Gaussian PRF subclass must be
+    # used instead of the optimized Gaussian PRF code path
+    params = QTable()
+    params['x_0'] = [25.0]
+    params['y_0'] = [25.0]
+    params['flux'] = [1.0]
+    model = DoubleCircularGaussianPRF(fwhm=2.7)
+    image = make_model_image((51, 51), model, params)
+    yy, xx = np.mgrid[0:51, 0:51]
+    expected = 2 * CircularGaussianPRF(x_0=25.0, y_0=25.0, fwhm=2.7)(xx, yy)
+    mask = image != 0
+    assert_allclose(image[mask], expected[mask])
+
+
+def test_make_model_image_gaussian_threads(monkeypatch):
+    monkeypatch.setattr(_optional_deps, 'HAS_NUMBA', False)
+
+    rng = np.random.default_rng(0)
+    params = QTable()
+    params['x_mean'] = rng.uniform(0, 120, 50)
+    params['y_mean'] = rng.uniform(0, 100, 50)
+    params['x_stddev'] = rng.uniform(1, 3, 50)
+    params['y_stddev'] = rng.uniform(1, 3, 50)
+    params['theta'] = np.where(rng.random(50) > 0.5, 0.0,
+                               rng.uniform(0, np.pi, 50))
+    params['amplitude'] = rng.uniform(1, 10, 50)
+    model = Gaussian2D()
+    shape = (100, 120)
+    image1 = make_model_image(shape, model, params, x_name='x_mean',
+                              y_name='y_mean')
+
+    # the sources are rendered in bands of rows that are disjoint, so
+    # the result must be identical to the serial result
+    monkeypatch.setattr(images.os, 'cpu_count', lambda: 3)
+    monkeypatch.setattr(images, '_THREAD_MIN_SOURCES', 1)
+    image2 = make_model_image(shape, model, params, x_name='x_mean',
+                              y_name='y_mean')
+    assert np.array_equal(image1, image2)
+
+
+@pytest.mark.parametrize('model', [CircularGaussianPRF(fwhm=2.7),
+                                   CircularGaussianSigmaPRF(sigma=1.3),
+                                   GaussianPRF(x_fwhm=2.1, y_fwhm=3.4),
+                                   GaussianPRF(x_fwhm=2.1, y_fwhm=3.4,
+                                               theta=30.0)])
+def test_make_model_image_gaussian_prf(model):
+    params = QTable()
+    params['x_0'] = [30.3, 50, 70.5, 1.2]
+    params['y_0'] = [40, 50.8, 60, 98.7]
+    params['flux'] = [10, 20, 30, 40]
+    shape = (100, 120)
+    model_shape = (25, 21)
+    image = make_model_image(shape, model, params, model_shape=model_shape)
+
+    expected = np.zeros(shape)
+    for row in params:
+        model.x_0 = row['x_0']
+        model.y_0 = row['y_0']
+        model.flux = row['flux']
+        slc_lg, _ = overlap_slices(shape, model_shape,
+                                   (row['y_0'], row['x_0']), mode='trim')
+        yy, xx = np.mgrid[slc_lg]
+        expected[slc_lg] += model(xx, yy)
+    assert_allclose(image, expected, rtol=1.0e-12, atol=1.0e-12)
+
+
+@pytest.mark.parametrize(('model', 'xy_names'),
+                         [(Gaussian2D(), ('x_mean', 'y_mean')),
+                          (Moffat2D(), ('x_0', 'y_0'))])
+def test_make_model_image_dtype(model, xy_names):
+    params = QTable()
+    params[xy_names[0]] = [30.3, 50, 70.5]
+    params[xy_names[1]] = [40, 50.8, 60]
+    params['amplitude'] = [10, 20, 30]
+    shape = (100, 120)
+    kwargs = {'model_shape': (25, 21), 'x_name': xy_names[0],
+              'y_name': xy_names[1]}
+    image1 = make_model_image(shape, model, params, **kwargs)
+    image2 = make_model_image(shape, model, params, dtype=np.float32,
+                              **kwargs)
+    assert image2.dtype == np.float32
+    assert_allclose(image2, image1, rtol=1.0e-6, atol=1.0e-6)
+
+    image = make_model_image(shape, model, params[:0], dtype=np.float32,
+                             **kwargs)
+    assert image.dtype == np.float32
+
+
+@pytest.mark.parametrize('model', [AiryDiskPSF(radius=3),
+                                   CircularGaussianPSF(fwhm=2.7),
+                                   GaussianPRF(x_fwhm=2.1, y_fwhm=3.4,
+                                               theta=30.0),
+                                   GaussianPSF(x_fwhm=2.1, y_fwhm=3.4,
+                                               theta=30.0),
+                                   MoffatPSF(alpha=2.5)])
+def test_make_model_image_batched(monkeypatch, model, use_numba):
+    monkeypatch.setattr(images, '_NUMBA_MIN_NPIXELS', 1)
+    # use small batches to test the batching
+    monkeypatch.setattr(images, '_BATCH_NPIXELS', 1000)
+
+    rng = np.random.default_rng(0)
+    params = QTable()
+    params['x_0'] = rng.uniform(-10, 130, 50)  # includes edge sources
+    params['y_0'] = rng.uniform(-10, 110, 50)
+    params['flux'] = rng.uniform(1, 10, 50)
+    params['local_bkg'] = rng.uniform(0, 1, 50)
+    shape = (100, 120)
+    model_shape = (25, 21)
+    image = make_model_image(shape, model, params, model_shape=model_shape)
+
+    # the batched result must be identical to rendering the sources
+    # one at a time
+    monkeypatch.setattr(images, '_is_batchable_model', lambda model: False)
+    expected = make_model_image(shape, model, params,
+                                model_shape=model_shape)
+    assert np.array_equal(image, expected)
+
+
+def test_gaussian_coefficients():
+    x_stddev = np.array([1.5, 2.3, 3.1])
+    y_stddev = np.array([2.2, 1.4, 3.7])
+    theta = np.array([0.0, 0.5, 2.0])
+    coeffs = _gaussian_coefficients(x_stddev, y_stddev, theta)
+
+    # evaluate the Gaussian2D exponent at (x, y) = (1, 1)
+    expected = -np.log(Gaussian2D.evaluate(1, 1, 1.0, 0.0, 0.0, x_stddev,
+                                           y_stddev, theta))
+    assert_allclose(np.sum(coeffs, axis=0), expected)
+
+
+def test_overlap_limits():
+    shape = (10, 10)
+    for cutout_size in (1, 4, 5):
+        for center in np.linspace(-5, 15, 81):
+            start, stop = _overlap_limits(shape[0], np.array([center]),
+                                          cutout_size)
+            try:
+                slc_lg, _ = overlap_slices(shape, (cutout_size, 1),
+                                           (center, 5), mode='trim')
+                assert (start[0], stop[0]) == (slc_lg[0].start,
+                                               slc_lg[0].stop)
+            except NoOverlapError:
+                assert start[0] == stop[0]
+
+
+def test_make_model_image_gaussian_integrate():
+    params = QTable()
+    params['x_mean'] = [10.3, 20.0]
+    params['y_mean'] = [10.0, 14.6]
+    params['x_stddev'] = [1.5, 0.7]
+    params['y_stddev'] = [0.9, 1.8]
+    params['amplitude'] = [10.0, 20.0]
+    model = Gaussian2D()
+    shape = (25, 30)
+    model_shape = (9, 9)
+    image1 = make_model_image(shape, model, params, model_shape=model_shape,
+                              x_name='x_mean', y_name='y_mean',
+                              discretize_method='integrate')
+    image2 = make_model_image(shape, model, params, model_shape=model_shape,
+                              x_name='x_mean', y_name='y_mean',
+                              discretize_method='oversample')
+    assert_allclose(image1, image2)
+
+    expected = np.zeros(shape)
+    for row in params:
+        gmodel = Gaussian2D(row['amplitude'], row['x_mean'], row['y_mean'],
+                            row['x_stddev'], row['y_stddev'])
+        slc_lg, _ = overlap_slices(shape, model_shape,
+                                   (row['y_mean'], row['x_mean']),
+                                   mode='trim')
+        x_range = (slc_lg[1].start, slc_lg[1].stop)
+        y_range = (slc_lg[0].start, slc_lg[0].stop)
+        expected[slc_lg] += discretize_model(gmodel, x_range=x_range,
+                                             y_range=y_range,
+                                             mode='oversample', factor=100)
+    assert_allclose(image1, expected, rtol=1.0e-4, atol=1.0e-6)
+
+
 def test_make_model_image_no_overlap():
     params = QTable()
     params['x_0'] = [50]
@@ -98,6 +410,18 @@ def test_make_model_image_no_overlap():
     assert np.sum(data) == 0
 
 
+def test_make_model_image_empty_table():
+    params = QTable()
+    params['x_0'] = np.array([])
+    params['y_0'] = np.array([])
+    params['gamma'] = np.array([])
+    params['alpha'] = np.array([])
+    shape = (10, 10)
+    data = make_model_image(shape, Moffat2D(), params, model_shape=(3, 3))
+    assert data.shape == shape
+    assert np.sum(data) == 0
+
+
 def test_make_model_image_inputs():
     match = 'shape must be a 2-tuple'
     with pytest.raises(ValueError, match=match):
@@ -197,3 +521,35 @@ def test_make_model_image_params_map():
     image2 = make_model_image(shape, model, params, model_shape=model_shape,
                               params_map=params_map)
     assert_allclose(image, image2)
+
+
+def test_make_model_image_gaussian_bbox():
+    params = QTable()
+    params['x_mean'] = [30.3, 50, 70.5]
+    params['y_mean'] = [40, 50.8, 60]
+    params['x_stddev'] = [1.5, 2.3, 3.1]
+    params['y_stddev'] = [2.2, 1.4, 3.7]
+    params['theta'] = [0.0, 0.5, 2.0]
+    model = Gaussian2D()
+    shape = (100, 120)
+    for bbox_factor in (None, 2.5):
+        image = make_model_image(shape, model, params, x_name='x_mean',
+                                 y_name='y_mean', bbox_factor=bbox_factor)
+
+        # the model shapes from the Gaussian2D bounding box
+        model_shapes = []
+        for row in params:
+            gmodel = Gaussian2D(1.0, row['x_mean'], row['y_mean'],
+                                row['x_stddev'], row['y_stddev'],
+                                row['theta'])
+            if bbox_factor is None:
+                bbox = gmodel.bounding_box.bounding_box()
+            else:
+                bbox = gmodel.bounding_box(factor=bbox_factor)
+            model_shapes.append((int(np.ceil(bbox[0][1] - bbox[0][0])),
+                                 int(np.ceil(bbox[1][1] - bbox[1][0]))))
+        params2 = params.copy()
+        params2['model_shape'] = model_shapes
+        expected = make_model_image(shape, model, params2, x_name='x_mean',
+                                    y_name='y_mean')
+        assert_allclose(image, expected)
@@ -5,9 +5,9 @@ Tests for the noise module.
 
 import numpy as np
 import pytest
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_equal
 
-from photutils.datasets import apply_poisson_noise, make_noise_image
+from photutils.datasets import apply_poisson_noise, make_noise_image, noise
 
 
 def test_apply_poisson_noise():
@@ -18,6 +18,18 @@ def test_apply_poisson_noise():
     assert_allclose(result.mean(), 1.0, atol=1.0)
 
 
+@pytest.mark.parametrize('shape', [(100, 100), (7,), ()])
+def test_apply_poisson_noise_dtype(monkeypatch, shape):
+    # use small tiles to test the tiling
+    monkeypatch.setattr(noise, '_TILE_BYTES', 256)
+    data = np.full(shape, 10.0)
+    result1 = apply_poisson_noise(data, seed=0)
+    result2 = apply_poisson_noise(data, seed=0, dtype=np.float32)
+    assert result2.shape == shape
+    assert result2.dtype == np.float32
+    assert_equal(result1, result2)
+
+
 def test_apply_poisson_noise_negative():
     """
     Test if negative image values raises ValueError.
@@ -43,6 +55,24 @@ def test_make_noise_image_poisson():
     assert_allclose(image.mean(), 1.0, atol=1.0)
 
 
+def test_make_noise_image_dtype(monkeypatch):
+    monkeypatch.setattr(noise, '_TILE_BYTES', 256)
+    shape = (100, 100)
+    image1 = make_noise_image(shape, 'poisson', mean=1.0, seed=0)
+    image2 = make_noise_image(shape, 'poisson', mean=1.0, seed=0,
+                              dtype=np.float32)
+    assert image2.dtype == np.float32
+    assert_equal(image1, image2)
+
+    image1 = make_noise_image(shape, 'gaussian', mean=3.0, stddev=2.0,
+                              seed=0)
+    for dtype in (np.float32, np.float64):
+        image2 = make_noise_image(shape, 'gaussian', mean=3.0, stddev=2.0,
+                                  seed=0, dtype=dtype)
+        assert image2.dtype == dtype
+        assert_equal(image1.astype(dtype), image2)
+
+
 def test_make_noise_image_nomean():
     """
     Test invalid inputs.
@@ -22,6 +22,18 @@ def test_make_wcs():
     assert wcs.wcs.ctype[1] == 'GLAT-CAR'
 
 
+def test_make_wcs_copy():
+    shape = (100, 200)
+    wcs1 = make_wcs(shape)
+    wcs1.wcs.crval = [0.0, 0.0]
+    wcs1.pixel_shape = (10, 10)
+
+    wcs2 = make_wcs(list(shape))
+    assert wcs2 is not wcs1
+    assert wcs2.pixel_shape == shape
+    assert_allclose(wcs2.wcs.crval, [197.8925, -1.36555556])
+
+
 @pytest.mark.skipif(not HAS_GWCS, reason='gwcs is required')
 def test_make_gwcs():
     shape = (100, 200)
@@ -3,6 +3,8 @@
 This module provides tools for making example WCS objects.
 """
 
+from functools import lru_cache
+
 import astropy.units as u
 import numpy as np
 from astropy import coordinates as coord
@@ -13,6 +15,17 @@ __all__ = ['make_gwcs', 'make_wcs']
 
 __doctest_requires__ = {'make_gwcs': ['gwcs']}
 
+# the CD matrix for a pixel scale of 0.1 arcsec/pixel (in deg/pixel)
+# and a rotation angle of 60 degrees
+_ROTATION = np.pi / 3.0
+_SCALE = 0.1 / 3600.0
+_CD_MATRIX = np.array(
+    [[-_SCALE * np.cos(_ROTATION), _SCALE * np.sin(_ROTATION)],
+     [_SCALE * np.sin(_ROTATION), _SCALE * np.cos(_ROTATION)]])
+_CD_MATRIX_INV = np.linalg.inv(_CD_MATRIX)
+_CD_MATRIX.flags.writeable = False
+_CD_MATRIX_INV.flags.writeable = False
+
 
 def make_wcs(shape, galactic=False):
     """
@@ -58,16 +71,38 @@ def make_wcs(shape, galactic=False):
     <SkyCoord (ICRS): (ra, dec) in deg
         (197.89278975, -1.36561284)>
     """
-    wcs = WCS(naxis=2)
-    rho = np.pi / 3.0
-    scale = 0.1 / 3600.0  # 0.1 arcsec/pixel in deg/pix
+    return _make_wcs(tuple(shape), bool(galactic)).deepcopy()
+
+
+@lru_cache(maxsize=8)
+def _make_wcs(shape, galactic):
+    """
+    Create a simple celestial `~astropy.wcs.WCS` object in either the
+    ICRS or Galactic coordinate frame.
+
+    The WCS objects are cached. `~astropy.wcs.WCS` objects are mutable,
+    so `make_wcs` returns a copy of the cached object.
 
+    Parameters
+    ----------
+    shape : tuple of int
+        The shape of the 2D array to be used with the output
+        `~astropy.wcs.WCS` object.
+
+    galactic : bool
+        Whether the output WCS will be in the Galactic coordinate frame.
+
+    Returns
+    -------
+    wcs : `astropy.wcs.WCS` object
+        The world coordinate system (WCS) transformation.
+    """
+    wcs = WCS(naxis=2)
     wcs.pixel_shape = shape
     wcs.wcs.crpix = [shape[1] / 2, shape[0] / 2]  # 1-indexed (x, y)
     wcs.wcs.crval = [197.8925, -1.36555556]
     wcs.wcs.cunit = ['deg', 'deg']
-    wcs.wcs.cd = [[-scale * np.cos(rho), scale * np.sin(rho)],
-                  [scale * np.sin(rho), scale * np.cos(rho)]]
+    wcs.wcs.cd = _CD_MATRIX
     if not galactic:
         wcs.wcs.radesys = 'ICRS'
         wcs.wcs.ctype = ['RA---TAN', 'DEC--TAN']
@@ -127,18 +162,12 @@ def make_gwcs(shape, galactic=False):
     from gwcs import coordinate_frames as cf
     from gwcs import wcs as gwcs_wcs
 
-    rho = np.pi / 3.0
-    scale = 0.1 / 3600.0  # 0.1 arcsec/pixel in deg/pix
-
     shift_by_crpix = (models.Shift((-shape[1] / 2) + 1)
                       & models.Shift((-shape[0] / 2) + 1))
 
-    cd_matrix = np.array([[-scale * np.cos(rho), scale * np.sin(rho)],
-                          [scale * np.sin(rho), scale * np.cos(rho)]])
-
-    rotation = models.AffineTransformation2D(cd_matrix, translation=[0, 0])
-    rotation.inverse = models.AffineTransformation2D(
-        np.linalg.inv(cd_matrix), translation=[0, 0])
+    rotation = models.AffineTransformation2D(_CD_MATRIX, translation=[0, 0])
+    rotation.inverse = models.AffineTransformation2D(_CD_MATRIX_INV,
+                                                     translation=[0, 0])
 
     tan = models.Pix2Sky_TAN()
     celestial_rotation = models.RotateNative2Celestial(197.8925, -1.36555556,
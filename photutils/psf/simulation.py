@@ -16,7 +16,7 @@ __all__ = ['make_psf_model_image']
 
 def make_psf_model_image(shape, psf_model, n_sources, *, model_shape=None,
                          min_separation=1, border_size=None, seed=0,
-                         progress_bar=False, **kwargs):
+                         progress_bar=False, dtype=float, **kwargs):
     """
     Make an example image containing PSF model images.
 
@@ -72,6 +72,11 @@ def make_psf_model_image(shape, psf_model, n_sources, *, model_shape=None,
         bar does not currently work in the Jupyter console due to
         limitations in ``tqdm``.
 
+    dtype : data-type, optional
+        The floating-point data type of the output image. Using
+        ``np.float32`` halves the memory of the output image, but the
+        pixel values have lower precision (about 7 significant digits).
+
     **kwargs
         Keyword arguments are accepted for additional model parameters.
         The values should be 2-tuples of the lower and upper bounds for
@@ -176,6 +181,6 @@ def make_psf_model_image(shape, psf_model, n_sources, *, model_shape=None,
 
     data = make_model_image(shape, psf_model, params, model_shape=model_shape,
                             x_name=x_name, y_name=y_name,
-                            progress_bar=progress_bar)
+                            progress_bar=progress_bar, dtype=dtype)
 
     return data, params
@@ -7,7 +7,7 @@ import numpy as np
 import pytest
 from astropy.modeling.models import Gaussian2D
 from astropy.table import Table
-from numpy.testing import assert_equal
+from numpy.testing import assert_allclose, assert_equal
 
 from photutils.psf import (CircularGaussianPRF, make_psf_model,
                            make_psf_model_image)
@@ -46,6 +46,17 @@ def test_make_psf_model_image():
     assert np.max(params['fwhm']) <= fwhm[1]
 
 
+def test_make_psf_model_image_dtype():
+    shape = (101, 151)
+    model = CircularGaussianPRF(fwhm=2.7)
+    data, params = make_psf_model_image(shape, model, 10, flux=(100, 200))
+    data2, params2 = make_psf_model_image(shape, model, 10, flux=(100, 200),
+                                          dtype=np.float32)
+    assert data2.dtype == np.float32
+    assert_equal(params.as_array(), params2.as_array())
+    assert_allclose(data2, data, rtol=1.0e-6, atol=1.0e-5)
+
+
 def test_make_psf_model_image_custom():
     shape = (401, 451)
     n_sources = 100
@@ -10,12 +10,29 @@ import numpy as np
 from astropy.utils.exceptions import AstropyUserWarning
 from scipy.spatial import KDTree
 
+from photutils.utils._numba import use_numba
 
-def apply_separation(xycoords, min_separation):
+# the minimum number of coordinates processed in each batch by
+# apply_separation when max_size is input
+_MIN_BATCH_SIZE = 1024
+
+# the minimum number of input coordinates for which apply_separation
+# uses the Numba kernel (if Numba is installed)
+_NUMBA_MIN_SIZE = 1 << 14
+
+# the maximum number of cells in the uniform grid used by
+# apply_separation when Numba is installed
+_MAX_GRID_CELLS = 1 << 22
+
+
+def apply_separation(xycoords, min_separation, max_size=None):
     """
     Apply a minimum separation to a set of (x, y) coordinates.
 
     Coordinates that are closer than the minimum separation are removed.
+    The coordinates are processed in order, i.e., a coordinate is
+    removed if it is within the minimum separation of any preceding
+    coordinate that was kept.
 
     Parameters
     ----------
@@ -25,13 +42,154 @@ def apply_separation(xycoords, min_separation):
     min_separation : float
         The minimum separation in pixels between coordinates.
 
+    max_size : int or `None`, optional
+        The maximum number of coordinates to return. If not `None`,
+        then the coordinates are processed in batches only until
+        ``max_size`` coordinates are kept. The result is identical to
+        ``apply_separation(xycoords, min_separation)[:max_size]``.
+
     Returns
     -------
     xycoords : `~numpy.ndarray`
         The (x, y) coordinates with shape ``(N, 2)`` after excluding
         points closer than the minimum separation.
+
+    Notes
+    -----
+    If `Numba <https://numba.pydata.org/>`_ is installed, a large
+    number of coordinates are processed in a single pass using a
+    uniform grid of cells whose size is the minimum separation.
+    Otherwise (or if the grid would be too large), KD-trees are used
+    to find the coordinates within the minimum separation. Both
+    methods give identical results.
     """
-    tree = KDTree(xycoords)
+    xycoords = np.asarray(xycoords)
+    if use_numba(len(xycoords), _NUMBA_MIN_SIZE):
+        grid = _make_grid(xycoords, min_separation)
+        if grid is not None:
+            from photutils.utils._kernels import separation_mask
+
+            if max_size is None:
+                max_size = len(xycoords)
+            mask = separation_mask(xycoords, min_separation, *grid,
+                                   max_size)
+            return xycoords[mask]
+
+    if max_size is None:
+        return _apply_separation(xycoords, min_separation)
+
+    # the kept coordinates are written into a preallocated array
+    # instead of repeatedly concatenating the batches
+    kept = np.empty((min(max_size, len(xycoords)), 2), dtype=xycoords.dtype)
+    nkept = 0
+    start = 0
+    while nkept < max_size and start < len(xycoords):
+        stop = start + max(max_size - nkept, _MIN_BATCH_SIZE)
+        batch = xycoords[start:stop]
+        start = stop
+
+        # remove the batch coordinates that are too close to the
+        # coordinates already kept
+        if nkept > 0:
+            tree = _make_kdtree(kept[:nkept])
+            nclose = tree.query_ball_point(batch, min_separation,
+                                           return_length=True, workers=-1)
+            batch = batch[nclose == 0]
+
+        batch = _apply_separation(batch, min_separation)
+        ntake = min(max_size - nkept, len(batch))
+        kept[nkept:nkept + ntake] = batch[:ntake]
+        nkept += ntake
+
+    return kept[:nkept]
+
+
+def _make_grid(xycoords, min_separation):
+    """
+    Compute the uniform grid cell indices of (x, y) coordinates.
+
+    The cell size is slightly larger than the minimum separation so
+    that coordinates within the minimum separation are always in
+    adjacent cells, even with floating-point rounding.
+
+    Parameters
+    ----------
+    xycoords : `~numpy.ndarray`
+        The (x, y) coordinates with shape ``(N, 2)``.
+
+    min_separation : float
+        The minimum separation in pixels between coordinates.
+
+    Returns
+    -------
+    result : tuple or `None`
+        A tuple of the x and y cell indices of each coordinate and
+        the number of cells along the x and y axes. `None` is returned
+        if the grid would be too large or if the coordinates are not
+        all finite.
+    """
+    if len(xycoords) == 0 or min_separation <= 0:
+        return None
+
+    cell_size = min_separation * (1 + 1e-6)
+    with np.errstate(invalid='ignore'):
+        max_coord = np.max(np.abs(xycoords))
+    if not np.isfinite(max_coord) or max_coord / cell_size > 1e7:
+        return None
+
+    xymin = np.min(xycoords, axis=0)
+    cells = np.floor((xycoords - xymin) / cell_size).astype(np.intp)
+    nxcells, nycells = np.max(cells, axis=0) + 1
+    if nxcells * nycells > _MAX_GRID_CELLS:
+        return None
+
+    return cells[:, 0], cells[:, 1], int(nxcells), int(nycells)
+
+
+def _make_kdtree(xycoords):
+    """
+    Make a `~scipy.spatial.KDTree` for a set of (x, y) coordinates.
+
+    The trees are used only for a single query, so they are built
+    without balancing the nodes (splitting at the midpoint instead of
+    the median) and without shrinking the node bounding boxes, which
+    is faster to build and query for uniformly distributed coordinates.
+
+    Parameters
+    ----------
+    xycoords : `~numpy.ndarray`
+        The (x, y) coordinates with shape ``(N, 2)``.
+
+    Returns
+    -------
+    tree : `~scipy.spatial.KDTree`
+        The KD-tree of the coordinates.
+    """
+    return KDTree(xycoords, balanced_tree=False, compact_nodes=False)
+
+
+def _apply_separation(xycoords, min_separation):
+    """
+    Apply a minimum separation to a set of (x, y) coordinates.
+
+    Parameters
+    ----------
+    xycoords : `~numpy.ndarray`
+        The (x, y) coordinates with shape ``(N, 2)``.
+
+    min_separation : float
+        The minimum separation in pixels between coordinates.
+
+    Returns
+    -------
+    xycoords : `~numpy.ndarray`
+        The (x, y) coordinates with shape ``(N, 2)`` after excluding
+        points closer than the minimum separation.
+    """
+    if len(xycoords) == 0:
+        return xycoords
+
+    tree = _make_kdtree(xycoords)
     pairs = tree.query_pairs(min_separation, output_type='ndarray')
 
     # create a dictionary of nearest neighbors (within min_separation)
@@ -80,18 +238,24 @@ def make_random_xycoords(size, x_range, y_range, min_separation=0.0,
     xycoords : `~numpy.ndarray`
         The (x, y) random coordinates with shape ``(size, 2)``.
     """
+    ncoords = size
     if min_separation > 0:
         # scale the number of random coordinates to account for
         # some being discarded due to min_separation
         ncoords = size * 10
 
+    # draw the x and y values with a single call to the random
+    # number generator; the values are identical to those from
+    # sequential rng.uniform calls for x and y
     rng = np.random.default_rng(seed)
-    xc = rng.uniform(x_range[0], x_range[1], ncoords)
-    yc = rng.uniform(y_range[0], y_range[1], ncoords)
-    xycoords = np.transpose(np.array((xc, yc)))
+    bounds = np.array((x_range, y_range), dtype=float)
+    lower = bounds[:, 0:1]
+    upper = bounds[:, 1:2]
+    xycoords = (lower + (upper - lower) * rng.random((2, ncoords))).T
 
-    xycoords = apply_separation(xycoords, min_separation)
-    xycoords = xycoords[:size]
+    if min_separation > 0:
+        xycoords = apply_separation(xycoords, min_separation,
+                                    max_size=size)
 
     if len(xycoords) < size:
         warnings.warn(f'Unable to produce {size!r} coordinates within the '
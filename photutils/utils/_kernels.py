@@ -0,0 +1,129 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+This module provides Numba-compiled kernels for the utils subpackage.
+
+This module requires `Numba <https://numba.pydata.org/>`_ and must be
+imported only when Numba is installed.
+"""
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True)
+def separation_mask(xycoords, min_separation, xcell, ycell, nxcells,
+                    nycells, max_size):
+    """
+    Compute the mask of (x, y) coordinates kept after applying a
+    minimum separation.
+
+    The coordinates are processed in order and a coordinate is kept
+    only if it is farther than ``min_separation`` from all of the
+    previously kept coordinates. The kept coordinates are stored in a
+    uniform grid of cells (as linked lists of coordinate indices) whose
+    size is at least ``min_separation``. Therefore, only the kept
+    coordinates in the 3x3 block of cells centered on each coordinate
+    need to be checked.
+
+    Parameters
+    ----------
+    xycoords : 2D `~numpy.ndarray`
+        The (x, y) coordinates with shape ``(N, 2)``.
+
+    min_separation : float
+        The minimum separation between coordinates.
+
+    xcell, ycell : 1D `~numpy.ndarray`
+        The integer grid cell indices of each coordinate.
+
+    nxcells, nycells : int
+        The number of grid cells along the x and y axes.
+
+    max_size : int
+        The maximum number of coordinates to keep. The remaining
+        coordinates are not processed once ``max_size`` coordinates
+        have been kept.
+
+    Returns
+    -------
+    mask : 1D bool `~numpy.ndarray`
+        The mask of the kept coordinates.
+    """
+    ncoords = xycoords.shape[0]
+    mask = np.zeros(ncoords, dtype=np.bool_)
+    head = np.full(nxcells * nycells, -1, dtype=np.intp)
+    nxt = np.full(ncoords, -1, dtype=np.intp)
+    max_dist2 = min_separation**2
+
+    nkept = 0
+    for i in range(ncoords):
+        if nkept >= max_size:
+            break
+
+        xc = xycoords[i, 0]
+        yc = xycoords[i, 1]
+        ix = xcell[i]
+        iy = ycell[i]
+        keep = True
+        for jy in range(max(iy - 1, 0), min(iy + 2, nycells)):
+            for jx in range(max(ix - 1, 0), min(ix + 2, nxcells)):
+                j = head[jy * nxcells + jx]
+                while j >= 0:
+                    xdiff = xc - xycoords[j, 0]
+                    ydiff = yc - xycoords[j, 1]
+                    if xdiff * xdiff + ydiff * ydiff <= max_dist2:
+                        keep = False
+                        break
+                    j = nxt[j]
+                if not keep:
+                    break
+            if not keep:
+                break
+
+        if keep:
+            mask[i] = True
+            cell = iy * nxcells + ix
+            nxt[i] = head[cell]
+            head[cell] = i
+            nkept += 1
+
+    return mask
+
+
+@njit(parallel=True, cache=True)
+def combine_errors(data, bkg_error, effective_gain, total_error):
+    """
+    Combine background-only errors with the Poisson noise of sources.
+
+    The total error is calculated in a single pass over the flattened
+    arrays, which is distributed across threads. The values are
+    identical to those from the equivalent NumPy expressions.
+
+    Parameters
+    ----------
+    data : 1D float `~numpy.ndarray`
+        The flattened background-subtracted data array.
+
+    bkg_error : 1D float `~numpy.ndarray`
+        The flattened 1-sigma background-only errors.
+
+    effective_gain : 1D float `~numpy.ndarray`
+        The flattened non-negative effective gain. If it has a single
+        element, then that value is used for all of the data values.
+
+    total_error : 1D float `~numpy.ndarray`
+        The output array for the flattened total errors.
+    """
+    scalar_gain = effective_gain.shape[0] == 1
+    for i in prange(data.shape[0]):
+        gain = effective_gain[0] if scalar_gain else effective_gain[i]
+        variance = bkg_error[i] * bkg_error[i]
+        # the source variance is not included where effective_gain = 0
+        # or where it is negative; NaN values are propagated
+        if gain != 0:
+            source_variance = data[i] / gain
+            if not source_variance <= 0:
+                variance += source_variance
+        total_error[i] = math.sqrt(variance)
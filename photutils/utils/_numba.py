@@ -0,0 +1,36 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+This module provides tools for using the optional Numba-compiled
+kernels.
+"""
+
+from photutils.utils import _optional_deps
+
+
+def use_numba(size, min_size):
+    """
+    Determine whether to use an optional Numba-compiled kernel.
+
+    Checking whether `Numba <https://numba.pydata.org/>`_ is installed
+    imports it, which takes much longer than the NumPy implementations
+    of the kernels for small inputs. Therefore, Numba is checked only if
+    the input size is at least ``min_size``.
+
+    Parameters
+    ----------
+    size : int
+        The size of the input (e.g., the number of array elements or
+        coordinates).
+
+    min_size : int
+        The minimum input size for which the Numba kernel is used.
+
+    Returns
+    -------
+    result : bool
+        Whether to use the Numba kernel.
+    """
+    if size < min_size:
+        return False
+
+    return _optional_deps.HAS_NUMBA
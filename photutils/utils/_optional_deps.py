@@ -12,7 +12,7 @@ import importlib
 # Note that in some cases the package names are different from the
 # pip-install name (e.g.k scikit-image -> skimage).
 optional_deps = ['matplotlib', 'regions', 'skimage', 'gwcs',
-                 'bottleneck', 'tqdm', 'rasterio', 'shapely']
+                 'bottleneck', 'tqdm', 'rasterio', 'shapely', 'numba']
 deps = {key.upper(): key for key in optional_deps}
 __all__ = [f'HAS_{pkg}' for pkg in deps]
 
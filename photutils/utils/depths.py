@@ -288,8 +288,8 @@ class ImageDepth:
                 # cut the number of coords (only need to input ~10x)
                 xycoords = self._make_coords(all_xycoords, napers * 10)
                 min_separation = self.aper_radius * 2.0
-                xycoords = apply_separation(xycoords, min_separation)
-                xycoords = xycoords[0:self.napers]
+                xycoords = apply_separation(xycoords, min_separation,
+                                            max_size=self.napers)
 
             apers = CircularAperture(xycoords, r=self.aper_radius)
             apertures.append(apers)
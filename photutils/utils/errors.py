@@ -5,10 +5,15 @@ This module provides tools for calculating total error arrays.
 
 import astropy.units as u
 import numpy as np
-from astropy.utils.misc import isiterable
+
+from photutils.utils._numba import use_numba
 
 __all__ = ['calc_total_error']
 
+# the minimum data size for which the total error is calculated with
+# the parallel Numba kernel (if Numba is installed)
+_NUMBA_MIN_SIZE = 1 << 16
+
 
 def calc_total_error(data, bkg_error, effective_gain):
     r"""
@@ -161,35 +166,135 @@ def calc_total_error(data, bkg_error, effective_gain):
                                f'{datagain_unit}, but it must have count '
                                'units (e.g., u.electron or u.photon).')
 
-    if not isiterable(effective_gain):
-        effective_gain = np.zeros(data.shape) + effective_gain
-    else:
-        effective_gain = np.asanyarray(effective_gain)
-        if effective_gain.shape != data.shape:
-            raise ValueError('If input effective_gain is 2D, then it must '
-                             'have the same shape as the input data.')
-    if np.any(effective_gain < 0):
+    effective_gain = np.asanyarray(effective_gain)
+    if effective_gain.ndim > 0 and effective_gain.shape != data.shape:
+        raise ValueError('If input effective_gain is 2D, then it must '
+                         'have the same shape as the input data.')
+    # a single reduction without a boolean temporary array; fmin (unlike
+    # min) ignores NaN values
+    if (effective_gain.size > 0
+            and np.fmin.reduce(effective_gain, axis=None) < 0):
         raise ValueError('effective_gain must be non-zero everywhere.')
 
     if use_units:
+        # the total error is calculated without units (avoiding the
+        # Quantity overhead for each operation) and is returned with
+        # the units of data (which are the same as bkg_error)
         unit = data.unit
         data = data.value
+        bkg_error = bkg_error.value
         effective_gain = effective_gain.value
 
-    # do not include source variance where effective_gain = 0
-    source_variance = data.copy()
-    mask = effective_gain != 0
-    source_variance[mask] /= effective_gain[mask]
-    source_variance[~mask] = 0.0
+    total_error = _calc_total_error(data, bkg_error, effective_gain)
+
+    if use_units:
+        total_error <<= unit
+
+    return total_error
+
+
+def _calc_total_error(data, bkg_error, effective_gain):
+    """
+    Calculate a total error array from validated inputs without units.
+
+    Parameters
+    ----------
+    data : `~numpy.ndarray`
+        The background-subtracted data array.
+
+    bkg_error : `~numpy.ndarray`
+        The 1-sigma background-only errors of the input ``data``.
+
+    effective_gain : `~numpy.ndarray`
+        The non-negative effective gain as a 0D array or an array with
+        the same shape as ``data``.
+
+    Returns
+    -------
+    total_error : `~numpy.ndarray`
+        The total error array.
+    """
+    if _use_numba(data, bkg_error, effective_gain):
+        from photutils.utils._kernels import combine_errors
+
+        total_error = np.empty_like(data)
+        combine_errors(data.ravel(), bkg_error.ravel(),
+                       effective_gain.ravel(), total_error.ravel())
+        return total_error
+
+    # the source variance is written directly into a new array instead
+    # of a copy of data
+    dtype = np.result_type(data, 1.0)
+    if effective_gain.ndim == 0:
+        # a scalar effective_gain is not broadcast to an array; an
+        # unmasked division is faster than a masked one
+        if effective_gain == 0:
+            source_variance = np.zeros_like(data, dtype=dtype)
+        else:
+            source_variance = np.empty_like(data, dtype=dtype)
+            np.divide(data, effective_gain, out=source_variance)
+    else:
+        # do not include source variance where effective_gain = 0; the
+        # division is evaluated only where it contributes
+        source_variance = np.zeros_like(data, dtype=dtype)
+        np.divide(data, effective_gain, out=source_variance,
+                  where=effective_gain != 0)
 
     # do not include source variance where data is negative (note that
-    # effective_gain cannot be negative)
-    source_variance = np.maximum(source_variance, 0)
+    # effective_gain cannot be negative); NaN values are propagated
+    np.maximum(source_variance, 0, out=source_variance)
+
+    # total_error = sqrt(bkg_error**2 + source_variance), computed in
+    # a single output array
+    if bkg_error.shape == source_variance.shape:
+        total_error = np.empty(source_variance.shape,
+                               dtype=np.result_type(bkg_error,
+                                                    source_variance))
+        np.square(bkg_error, out=total_error)
+        total_error += source_variance
+    else:
+        total_error = bkg_error**2 + source_variance
+    np.sqrt(total_error, out=total_error)
 
-    if use_units:
-        # source_variance is calculated to have units of (data.unit)**2
-        # so that it can be added with bkg_error**2 below. The returned
-        # total error will have units of data.unit.
-        source_variance <<= unit**2
+    return total_error
+
+
+def _use_numba(data, bkg_error, effective_gain):
+    """
+    Determine whether the total error can be calculated with the
+    Numba kernel.
+
+    The kernel is used only if Numba is installed and only for large
+    C-contiguous float64 arrays with the same shape (or a scalar
+    effective_gain), where it gives results identical to the NumPy
+    implementation.
+
+    Parameters
+    ----------
+    data : `~numpy.ndarray`
+        The background-subtracted data array.
+
+    bkg_error : `~numpy.ndarray`
+        The 1-sigma background-only errors of the input ``data``.
+
+    effective_gain : `~numpy.ndarray`
+        The non-negative effective gain as a 0D array or an array with
+        the same shape as ``data``.
+
+    Returns
+    -------
+    result : bool
+        Whether to use the Numba kernel.
+    """
+    if bkg_error.shape != data.shape:
+        return False
+
+    if effective_gain.ndim > 0 and effective_gain.shape != data.shape:
+        return False
+
+    arrays = (data, bkg_error, effective_gain)
+    if not all(type(arr) is np.ndarray and arr.dtype == np.float64
+               and arr.flags.c_contiguous for arr in arrays):
+        return False
 
-    return np.sqrt(bkg_error**2 + source_variance)
+    return use_numba(data.size, _NUMBA_MIN_SIZE)
@@ -0,0 +1,76 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+Tests for the _coords module.
+"""
+
+import numpy as np
+import pytest
+from astropy.utils.exceptions import AstropyUserWarning
+from numpy.testing import assert_equal
+from scipy.spatial.distance import pdist
+
+from photutils.utils import _coords, _optional_deps
+from photutils.utils._coords import (_apply_separation, apply_separation,
+                                     make_random_xycoords)
+from photutils.utils._optional_deps import HAS_NUMBA
+
+
+@pytest.mark.parametrize('max_size', [1, 10, 100, 1000])
+def test_apply_separation_max_size(monkeypatch, max_size):
+    # use small batches to test the batching
+    monkeypatch.setattr(_coords, '_MIN_BATCH_SIZE', 16)
+    rng = np.random.default_rng(0)
+    xycoords = rng.uniform(0, 50, (2000, 2))
+    min_separation = 2.5
+
+    expected = apply_separation(xycoords, min_separation)
+    result = apply_separation(xycoords, min_separation, max_size=max_size)
+    assert_equal(result, expected[:max_size])
+    assert np.all(pdist(result) > min_separation)
+
+
+@pytest.mark.skipif(not HAS_NUMBA, reason='numba is required')
+@pytest.mark.parametrize('max_grid_cells', [1, 1 << 22])
+@pytest.mark.parametrize('max_size', [None, 1, 100])
+def test_apply_separation_grid(monkeypatch, max_grid_cells, max_size):
+    monkeypatch.setattr(_coords, '_NUMBA_MIN_SIZE', 1)
+    monkeypatch.setattr(_coords, '_MAX_GRID_CELLS', max_grid_cells)
+    rng = np.random.default_rng(0)
+    # integer coordinates to include separations equal to
+    # min_separation
+    xycoords = rng.integers(0, 50, (2000, 2)).astype(float)
+    min_separation = 3.0
+
+    expected = _apply_separation(xycoords, min_separation)[:max_size]
+    result = apply_separation(xycoords, min_separation, max_size=max_size)
+    assert_equal(result, expected)
+
+    monkeypatch.setattr(_optional_deps, 'HAS_NUMBA', False)
+    result = apply_separation(xycoords, min_separation, max_size=max_size)
+    assert_equal(result, expected)
+
+
+def test_apply_separation_empty():
+    xycoords = np.empty((0, 2))
+    assert apply_separation(xycoords, 1.0).shape == (0, 2)
+    assert apply_separation(xycoords, 1.0, max_size=5).shape == (0, 2)
+
+
+def test_make_random_xycoords():
+    xycoords = make_random_xycoords(100, (0, 50), (10, 20), seed=0)
+    assert xycoords.shape == (100, 2)
+    assert np.all((xycoords[:, 0] >= 0) & (xycoords[:, 0] <= 50))
+    assert np.all((xycoords[:, 1] >= 10) & (xycoords[:, 1] <= 20))
+
+    xycoords = make_random_xycoords(100, (0, 50), (0, 50),
+                                    min_separation=3, seed=0)
+    assert xycoords.shape == (100, 2)
+    assert np.all(pdist(xycoords) > 3)
+
+
+def test_make_random_xycoords_too_many():
+    match = 'Unable to produce 1000 coordinates'
+    with pytest.warns(AstropyUserWarning, match=match):
+        xycoords = make_random_xycoords(1000, (0, 50), (0, 50),
+                                        min_separation=10, seed=0)
+    assert 0 < len(xycoords) < 1000
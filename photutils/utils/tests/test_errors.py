@@ -6,8 +6,10 @@ Tests for the errors module.
 import astropy.units as u
 import numpy as np
 import pytest
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_equal
 
+from photutils.utils import _optional_deps, errors
+from photutils.utils._optional_deps import HAS_NUMBA
 from photutils.utils.errors import calc_total_error
 
 SHAPE = (5, 5)
@@ -38,11 +40,34 @@ def test_gain_negative(effective_gain):
         calc_total_error(DATA, BKG_ERROR, effective_gain)
 
 
+def test_gain_negative_nan():
+    effgain = np.copy(EFFGAIN)
+    effgain[0, 0] = np.nan
+    effgain[1, 1] = -1.0
+    match = 'effective_gain must be non-zero everywhere'
+    with pytest.raises(ValueError, match=match):
+        calc_total_error(DATA, BKG_ERROR, effgain)
+
+
 def test_gain_scalar():
     error_tot = calc_total_error(DATA, BKG_ERROR, 2.0)
     assert_allclose(error_tot, np.sqrt(2.0) * BKG_ERROR)
 
 
+@pytest.mark.parametrize('effective_gain', [np.array(2.0), [[2.0] * 5] * 5])
+def test_gain_scalar_array(effective_gain):
+    error_tot = calc_total_error(DATA, BKG_ERROR, effective_gain)
+    assert_allclose(error_tot, np.sqrt(2.0) * BKG_ERROR)
+
+
+def test_gain_scalar_units():
+    units = u.electron / u.s
+    error_tot = calc_total_error(DATA * units, BKG_ERROR * units,
+                                 2.0 * u.s)
+    assert error_tot.unit == units
+    assert_allclose(error_tot.value, np.sqrt(2.0) * BKG_ERROR)
+
+
 def test_gain_array():
     error_tot = calc_total_error(DATA, BKG_ERROR, EFFGAIN)
     assert_allclose(error_tot, np.sqrt(2.0) * BKG_ERROR)
@@ -61,6 +86,51 @@ def test_gain_zero():
     assert_allclose(error_tot[~mask], np.sqrt(2))
 
 
+@pytest.mark.parametrize('effective_gain', [2.0, EFFGAIN])
+def test_negative_nan_data(effective_gain):
+    data = np.copy(DATA)
+    data[0, 0] = -1.0
+    data[1, 1] = np.nan
+    error_tot = calc_total_error(data, BKG_ERROR, effective_gain)
+    assert error_tot[0, 0] == BKG_ERROR[0, 0]
+    assert np.isnan(error_tot[1, 1])
+    assert_allclose(error_tot[2:], np.sqrt(2.0) * BKG_ERROR[2:])
+
+
+@pytest.mark.skipif(not HAS_NUMBA, reason='numba is required')
+@pytest.mark.parametrize('effective_gain', [0.0, 2.0, EFFGAIN])
+def test_numba(monkeypatch, effective_gain):
+    monkeypatch.setattr(errors, '_NUMBA_MIN_SIZE', 1)
+    data = np.copy(DATA)
+    data[0, 0] = -1.0
+    data[1, 1] = np.nan
+    data[2, 2] = 0.0
+    data[3] = 7.3
+    effective_gain = np.copy(effective_gain)
+    if effective_gain.ndim > 0:
+        effective_gain[4, 4] = 0.0
+
+    error_tot1 = calc_total_error(data, BKG_ERROR, effective_gain)
+    monkeypatch.setattr(_optional_deps, 'HAS_NUMBA', False)
+    error_tot2 = calc_total_error(data, BKG_ERROR, effective_gain)
+    assert_equal(error_tot1, error_tot2)
+
+
+def test_gain_nan(monkeypatch, use_numba):
+    monkeypatch.setattr(errors, '_NUMBA_MIN_SIZE', 1)
+    data = np.array([[-1.0, 4.0, 4.0]])
+    bkg_error = np.ones(data.shape)
+
+    # NaN effective_gain values are propagated, even where data is
+    # negative
+    effective_gain = np.array([[np.nan, np.nan, 2.0]])
+    error_tot = calc_total_error(data, bkg_error, effective_gain)
+    assert_equal(error_tot, [[np.nan, np.nan, np.sqrt(3.0)]])
+
+    error_tot = calc_total_error(data, bkg_error, np.nan)
+    assert np.all(np.isnan(error_tot))
+
+
 def test_units():
     units = u.electron / u.s
     error_tot1 = calc_total_error(DATA * units, BKG_ERROR * units,
@@ -0,0 +1,31 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+Tests for the _numba module.
+"""
+
+import pytest
+
+from photutils.utils import _optional_deps
+from photutils.utils._numba import use_numba
+
+
+def test_use_numba_small_input(monkeypatch):
+    """
+    Test that Numba is not checked (and therefore not imported) for
+    small inputs.
+    """
+    def getattr_(name):
+        msg = f'{name} should not be checked for small inputs'
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(_optional_deps, '__getattr__', getattr_)
+    assert not use_numba(0, 100)
+    assert not use_numba(99, 100)
+
+
+@pytest.mark.parametrize('has_numba', [False, True])
+def test_use_numba(monkeypatch, has_numba):
+    monkeypatch.setattr(_optional_deps, 'HAS_NUMBA', has_numba)
+    assert use_numba(100, 100) is has_numba
+    assert use_numba(1000, 100) is has_numba
+    assert not use_numba(99, 100)